@@ -1,59 +1,42 @@
 # GUARDIAN v2.2 - Elite Agents Module
 # 6 Advanced specialized agents for Solana security
+# Exports resolve lazily (PEP 562) so `import GUARDIAN` stays cheap
+import importlib
+from typing import TYPE_CHECKING
 
-from .agents.specialized import (
-    # Elite Agents
-    LazarusAgent,
-    QuantumAgent,
-    HoneypotAgent,
-    NetworkAgent,
-    SwapGuardAgent,
-    EvacuatorAgent,
-    
-    # SwapGuard utilities
-    SwapRequest,
-    SwapDecision,
-    SwapAction,
-    SwapRisk,
-    TokenAnalysis,
-    get_swapguard,
-    evaluate_swap,
-    
-    # Evacuator utilities
-    EvacuationPlan,
-    EvacuationResult,
-    EvacuationStatus,
-    ThreatUrgency,
-    WalletAsset,
-    get_evacuator,
-    emergency_evacuate,
-)
+from .agents.specialized import _AGENT_REGISTRY, _LAZY as _SPECIALIZED_LAZY
+
+if TYPE_CHECKING:
+    # Static analyzers that read this file rather than __init__.pyi still
+    # see the real symbols; at runtime __getattr__ below resolves them.
+    from .agents.specialized import (
+        LazarusAgent,
+        QuantumAgent,
+        HoneypotAgent,
+        NetworkAgent,
+        SwapGuardAgent,
+        EvacuatorAgent,
+    )
 
 __version__ = "2.2.0"
-__all__ = [
-    # Agents
-    "LazarusAgent",
-    "QuantumAgent", 
-    "HoneypotAgent",
-    "NetworkAgent",
-    "SwapGuardAgent",
-    "EvacuatorAgent",
-    
-    # SwapGuard utilities
-    "SwapRequest",
-    "SwapDecision",
-    "SwapAction", 
-    "SwapRisk",
-    "TokenAnalysis",
-    "get_swapguard",
-    "evaluate_swap",
-    
-    # Evacuator utilities
-    "EvacuationPlan",
-    "EvacuationResult",
-    "EvacuationStatus",
-    "ThreatUrgency",
-    "WalletAsset",
-    "get_evacuator",
-    "emergency_evacuate",
-]
+
+# The export map lives in agents/specialized/__init__.py; re-key it here
+# so this package resolves the same names without a second copy.
+_LAZY = {name: ".agents.specialized" + module for name, module in _SPECIALIZED_LAZY.items()}
+
+# Only the agents are advertised; SwapGuard/Evacuator helpers live in
+# GUARDIAN.swap and GUARDIAN.evacuate. The old names still resolve lazily.
+__all__ = list(_AGENT_REGISTRY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ is only hit once
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
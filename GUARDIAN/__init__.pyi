@@ -0,0 +1,11 @@
+# Static view of the lazily-loaded exports in __init__.py, so IDEs and
+# type checkers resolve names without importing every agent at runtime.
+from .agents.specialized.lazarus_agent import LazarusAgent as LazarusAgent
+from .agents.specialized.quantum_agent import QuantumAgent as QuantumAgent
+from .agents.specialized.honeypot_agent import HoneypotAgent as HoneypotAgent
+from .agents.specialized.network_agent import NetworkAgent as NetworkAgent
+from .agents.specialized.swapguard_agent import SwapGuardAgent as SwapGuardAgent
+from .agents.specialized.evacuator_agent import EvacuatorAgent as EvacuatorAgent
+
+__version__: str
+__all__: list[str]
@@ -1,56 +1,24 @@
 # GUARDIAN Elite Agents
-from .specialized import (
-    # Agents
-    LazarusAgent,
-    QuantumAgent,
-    HoneypotAgent,
-    NetworkAgent,
-    SwapGuardAgent,
-    EvacuatorAgent,
-    
-    # SwapGuard utilities
-    SwapRequest,
-    SwapDecision,
-    SwapAction,
-    SwapRisk,
-    TokenAnalysis,
-    get_swapguard,
-    evaluate_swap,
-    
-    # Evacuator utilities
-    EvacuationPlan,
-    EvacuationResult,
-    EvacuationStatus,
-    ThreatUrgency,
-    WalletAsset,
-    get_evacuator,
-    emergency_evacuate,
-)
+# Exports resolve lazily (PEP 562); see specialized/__init__.py
+import importlib
 
-__all__ = [
-    # Agents
-    "LazarusAgent",
-    "QuantumAgent",
-    "HoneypotAgent", 
-    "NetworkAgent",
-    "SwapGuardAgent",
-    "EvacuatorAgent",
-    
-    # SwapGuard
-    "SwapRequest",
-    "SwapDecision",
-    "SwapAction",
-    "SwapRisk", 
-    "TokenAnalysis",
-    "get_swapguard",
-    "evaluate_swap",
-    
-    # Evacuator
-    "EvacuationPlan",
-    "EvacuationResult",
-    "EvacuationStatus",
-    "ThreatUrgency",
-    "WalletAsset",
-    "get_evacuator",
-    "emergency_evacuate",
-]
+from .specialized import _LAZY as _SPECIALIZED_LAZY
+
+# The export map lives in agents/specialized/__init__.py; re-key it here
+# so this package resolves the same names without a second copy.
+_LAZY = {name: ".specialized" + module for name, module in _SPECIALIZED_LAZY.items()}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ is only hit once
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,69 +1,79 @@
 # Specialized Agents for Solana Immune System
 # 16 Autonomous Agents - Complete Security Swarm
 
-# Original 10 Agents (in agents/specialized/)
-# - SentinelAgent, ScannerAgent, OracleAgent, CoordinatorAgent
-# - GuardianAgent, IntelAgent, ReporterAgent, AuditorAgent
-# - HunterAgent, HealerAgent
-
 # Elite Agents v2.0+ (in GUARDIAN/agents/specialized/)
-from .lazarus_agent import LazarusAgent      # 🇰🇵 DPRK/State-actor tracking
-from .quantum_agent import QuantumAgent      # ⚛️ Post-quantum defense
-from .honeypot_agent import HoneypotAgent    # 🪤 Active bait wallet traps
-from .network_agent import NetworkAgent      # 🌐 Solana infrastructure health
-from .swapguard_agent import SwapGuardAgent  # 🛡️ Risk-aware DEX trading (v2.1)
-from .evacuator_agent import EvacuatorAgent  # 🚨 Emergency wallet evacuation (v2.2)
+# Submodules are imported lazily (PEP 562) on first attribute access, so
+# `from GUARDIAN.agents.specialized import LazarusAgent` only loads
+# lazarus_agent and leaves the other agents untouched.
+import importlib
+import os
+import pathlib
 
-# SwapGuard convenience exports
-from .swapguard_agent import (
-    SwapRequest,
-    SwapDecision,
-    SwapAction,
-    SwapRisk,
-    TokenAnalysis,
-    get_swapguard,
-    evaluate_swap,
+# Numba kernels in the agent modules compile with cache=True; point the
+# cache at a writable per-user directory before any submodule is loaded
+# so later processes load compiled code from disk instead of re-lowering.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    str(pathlib.Path.home() / ".cache" / "guardian_numba"),
 )
 
-# Evacuator convenience exports
-from .evacuator_agent import (
-    EvacuationPlan,
-    EvacuationResult,
-    EvacuationStatus,
-    ThreatUrgency,
-    WalletAsset,
-    get_evacuator,
-    emergency_evacuate,
+# Original 10 Agents (in agents/specialized/)
+_CORE_AGENTS = (
+    "SentinelAgent", "ScannerAgent", "OracleAgent", "CoordinatorAgent",
+    "GuardianAgent", "IntelAgent", "ReporterAgent", "AuditorAgent",
+    "HunterAgent", "HealerAgent",
 )
 
-__all__ = [
-    # Elite Agents (v2.0)
-    "LazarusAgent",     # 🇰🇵 DPRK state-actor tracking
-    "QuantumAgent",     # ⚛️ Post-quantum readiness
-    "HoneypotAgent",    # 🪤 Active bait wallet traps
-    "NetworkAgent",     # 🌐 Solana network health
-    
+# Elite agents: class name -> defining submodule
+_AGENT_REGISTRY = {
+    "LazarusAgent": ".lazarus_agent",  # 🇰🇵 DPRK/State-actor tracking (v2.0)
+    "QuantumAgent": ".quantum_agent",  # ⚛️ Post-quantum defense (v2.0)
+    "HoneypotAgent": ".honeypot_agent",  # 🪤 Active bait wallet traps (v2.0)
+    "NetworkAgent": ".network_agent",  # 🌐 Solana infrastructure health (v2.0)
+    "SwapGuardAgent": ".swapguard_agent",  # 🛡️ Risk-aware DEX trading (v2.1)
+    "EvacuatorAgent": ".evacuator_agent",  # 🚨 Emergency wallet evacuation (v2.2)
+}
+
+_LAZY = {
+    **_AGENT_REGISTRY,
+
     # Trading Protection (v2.1)
-    "SwapGuardAgent",   # 🛡️ Risk-aware DEX trading
-    "SwapRequest",
-    "SwapDecision", 
-    "SwapAction",
-    "SwapRisk",
-    "TokenAnalysis",
-    "get_swapguard",
-    "evaluate_swap",
-    
+    "SwapRequest": ".swapguard_agent",
+    "SwapDecision": ".swapguard_agent",
+    "SwapAction": ".swapguard_agent",
+    "SwapRisk": ".swapguard_agent",
+    "TokenAnalysis": ".swapguard_agent",
+    "WarnFlag": ".swapguard_agent",
+    "get_swapguard": ".swapguard_agent",
+    "new_request_id": ".swapguard_agent",
+    "evaluate_swap": ".swapguard_agent",
+
     # Emergency Evacuation (v2.2)
-    "EvacuatorAgent",   # 🚨 Emergency wallet evacuation
-    "EvacuationPlan",
-    "EvacuationResult",
-    "EvacuationStatus",
-    "ThreatUrgency",
-    "WalletAsset",
-    "get_evacuator",
-    "emergency_evacuate",
-]
+    "EvacuationPlan": ".evacuator_agent",
+    "EvacuationResult": ".evacuator_agent",
+    "EvacuationStatus": ".evacuator_agent",
+    "ThreatUrgency": ".evacuator_agent",
+    "WalletAsset": ".evacuator_agent",
+    "get_evacuator": ".evacuator_agent",
+    "emergency_evacuate": ".evacuator_agent",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ is only hit once
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
-# Agent count: 16 (10 original + 6 elite)
-AGENT_COUNT = 16
-ELITE_AGENT_COUNT = 6
+# Agent count: 10 original + elite, derived so it cannot drift from the registry
+ELITE_AGENT_COUNT = len(_AGENT_REGISTRY)
+AGENT_COUNT = len(_CORE_AGENTS) + ELITE_AGENT_COUNT
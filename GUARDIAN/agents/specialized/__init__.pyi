@@ -0,0 +1,33 @@
+# Static view of the lazily-loaded exports in __init__.py, so IDEs and
+# type checkers resolve names without importing every agent at runtime.
+from .lazarus_agent import LazarusAgent as LazarusAgent
+from .quantum_agent import QuantumAgent as QuantumAgent
+from .honeypot_agent import HoneypotAgent as HoneypotAgent
+from .network_agent import NetworkAgent as NetworkAgent
+from .swapguard_agent import (
+    SwapGuardAgent as SwapGuardAgent,
+    SwapRequest as SwapRequest,
+    SwapDecision as SwapDecision,
+    SwapAction as SwapAction,
+    SwapRisk as SwapRisk,
+    TokenAnalysis as TokenAnalysis,
+    WarnFlag as WarnFlag,
+    get_swapguard as get_swapguard,
+    new_request_id as new_request_id,
+    evaluate_swap as evaluate_swap,
+)
+from .evacuator_agent import (
+    EvacuatorAgent as EvacuatorAgent,
+    EvacuationPlan as EvacuationPlan,
+    EvacuationResult as EvacuationResult,
+    EvacuationStatus as EvacuationStatus,
+    ThreatUrgency as ThreatUrgency,
+    WalletAsset as WalletAsset,
+    get_evacuator as get_evacuator,
+    emergency_evacuate as emergency_evacuate,
+)
+
+__all__: list[str]
+
+AGENT_COUNT: int
+ELITE_AGENT_COUNT: int
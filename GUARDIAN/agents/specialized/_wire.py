@@ -0,0 +1,27 @@
+"""
+Wire serialization for agent task results
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a task result to JSON bytes (datetimes as ISO 8601)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default).encode()
+
+
+def _default(obj: Any) -> Any:
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "value"):  # Enum
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -9,16 +9,48 @@ The emergency exit for Solana wallets.
 """
 
 import asyncio
-import base64
+import functools
+import itertools
+import os
+import struct
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
-import json
 
 from agents.core.base_agent import BaseAgent
 
 
+# SPL token programs whose accounts are evacuated
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+SOL_MINT = "So11111111111111111111111111111111111111112"
+ASSOCIATED_TOKEN_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+SYSTEM_PROGRAM_ID = "11111111111111111111111111111111"
+
+# Instruction tags
+_TRANSFER_CHECKED = 12  # SPL Token / Token-2022 TransferChecked
+_CREATE_ATA_IDEMPOTENT = 1  # Associated Token Account CreateIdempotent
+
+# Jito bundles hold at most 5 transactions; we pack a few ops into each
+JITO_MAX_BUNDLE_TXS = 5
+BUNDLE_OPS_PER_TX = 4
+
+# Wallets whose account snapshots are kept before the oldest is evicted
+WALLET_CACHE_MAX = 1024
+
+# Fee model
+_CU_LIMIT = 200_000  # Compute units budgeted per transaction
+_BASE_FEE_LAMPORTS = 5000  # 0.000005 SOL per signature
+_LAMPORTS_PER_SOL = 1_000_000_000
+
+# Approval risk levels -> wallet risk score contribution
+_RISK_SCORE = {"critical": 30, "high": 20, "medium": 10}
+_HIGH_RISK = frozenset({"high", "critical"})
+
+
 class EvacuationStatus(Enum):
     """Status of an evacuation operation"""
     PENDING = "pending"
@@ -38,6 +70,15 @@ class ThreatUrgency(Enum):
     CRITICAL = "critical" # Immediate action required
 
 
+# Expected seconds per transaction (depends on urgency and network conditions)
+_SECONDS_PER_TX = {
+    ThreatUrgency.LOW: 30,
+    ThreatUrgency.MEDIUM: 15,
+    ThreatUrgency.HIGH: 5,
+    ThreatUrgency.CRITICAL: 2,
+}
+
+
 class AssetType(Enum):
     """Types of assets to evacuate"""
     SOL = "sol"
@@ -46,7 +87,7 @@ class AssetType(Enum):
     STAKE = "stake"
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletAsset:
     """An asset in a wallet"""
     asset_type: AssetType
@@ -57,13 +98,33 @@ class WalletAsset:
     value_usd: float
     token_account: Optional[str] = None  # Associated token account
     is_nft: bool = False
+    token_program: Optional[str] = None  # Owning token program (Token or Token-2022)
+    amount_raw: Optional[int] = None  # Exact on-chain amount in base units (tokens)
+    
+    # Prebuilt instruction factory, attached at plan time (see _make_transfer_builder)
+    build_ixs: Optional[Callable[[], list]] = field(default=None, repr=False, compare=False)
     
     def lamports(self) -> int:
-        """Get balance in smallest units"""
+        """Get balance in smallest units (exact when the raw on-chain amount is known)"""
+        if self.amount_raw is not None:
+            return self.amount_raw
         return int(self.balance * (10 ** self.decimals))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.asset_type.value,
+            "mint": self.mint,
+            "symbol": self.symbol,
+            "balance": self.balance,
+            "decimals": self.decimals,
+            "value_usd": self.value_usd,
+            "token_account": self.token_account,
+            "is_nft": self.is_nft,
+            "token_program": self.token_program,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class DangerousApproval:
     """A token approval that could be exploited"""
     token_mint: str
@@ -74,7 +135,7 @@ class DangerousApproval:
     reason: str
 
 
-@dataclass 
+@dataclass(slots=True)
 class EvacuationPlan:
     """Plan for evacuating a wallet"""
     source_wallet: str
@@ -98,17 +159,21 @@ class EvacuationPlan:
     use_jito_bundles: bool = False
     
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    
+    # Assets split by kind once at planning time
+    token_assets: List[WalletAsset] = field(default_factory=list)
+    sol_asset: Optional[WalletAsset] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EvacuationResult:
     """Result of an evacuation operation"""
     plan: EvacuationPlan
     status: EvacuationStatus
     
     # Results
-    assets_evacuated: List[Dict]
-    assets_failed: List[Dict]
+    assets_evacuated: List[WalletAsset]
+    assets_failed: List[WalletAsset]
     approvals_revoked: List[str]
     approvals_failed: List[str]
     
@@ -127,6 +192,90 @@ class EvacuationResult:
     errors: List[str]
 
 
+@functools.lru_cache(maxsize=1)
+def _program_keys() -> tuple:
+    """(Associated Token program, System program) as Pubkeys, resolved once"""
+    from solders.pubkey import Pubkey
+    return (
+        Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID),
+        Pubkey.from_string(SYSTEM_PROGRAM_ID),
+    )
+
+
+def _spl_transfer_ixs(
+    *,
+    token_program,
+    source,
+    destination,
+    destination_wallet,
+    owner,
+    mint,
+    data: bytes,
+) -> list:
+    """Build [create destination ATA (idempotent), TransferChecked] from resolved Pubkeys"""
+    from solders.instruction import AccountMeta, Instruction
+    
+    ata_program, system_program = _program_keys()
+    return [
+        Instruction(
+            program_id=ata_program,
+            accounts=[
+                AccountMeta(owner, is_signer=True, is_writable=True),  # payer
+                AccountMeta(destination, is_signer=False, is_writable=True),
+                AccountMeta(destination_wallet, is_signer=False, is_writable=False),  # ATA owner
+                AccountMeta(mint, is_signer=False, is_writable=False),
+                AccountMeta(system_program, is_signer=False, is_writable=False),
+                AccountMeta(token_program, is_signer=False, is_writable=False),
+            ],
+            data=bytes([_CREATE_ATA_IDEMPOTENT]),
+        ),
+        Instruction(
+            program_id=token_program,
+            accounts=[
+                AccountMeta(source, is_signer=False, is_writable=True),
+                AccountMeta(mint, is_signer=False, is_writable=False),
+                AccountMeta(destination, is_signer=False, is_writable=True),
+                AccountMeta(owner, is_signer=True, is_writable=False),  # authority
+            ],
+            data=data,
+        ),
+    ]
+
+
+def _make_transfer_builder(asset: WalletAsset, owner: str, destination_wallet: str) -> Callable[[], list]:
+    """
+    Specialize the transfer instructions for one asset.
+    
+    Pubkeys, the destination ATA and the encoded amount are resolved and
+    the instructions built once here, so sending (and every retry) just
+    calls the result for a fresh list of the same instructions.
+    """
+    from solders.pubkey import Pubkey
+    
+    token_program = Pubkey.from_string(asset.token_program or TOKEN_PROGRAM_ID)
+    wallet_key = Pubkey.from_string(destination_wallet)
+    mint_key = Pubkey.from_string(asset.mint)
+    destination_ata, _ = Pubkey.find_program_address(
+        [bytes(wallet_key), bytes(token_program), bytes(mint_key)],
+        _program_keys()[0],
+    )
+    data = (
+        struct.pack("<B", _TRANSFER_CHECKED) +
+        struct.pack("<Q", asset.lamports()) +  # amount: u64
+        struct.pack("<B", asset.decimals)      # decimals: u8
+    )
+    instructions = _spl_transfer_ixs(
+        token_program=token_program,
+        source=Pubkey.from_string(asset.token_account),
+        destination=destination_ata,
+        destination_wallet=wallet_key,
+        owner=Pubkey.from_string(owner),
+        mint=mint_key,
+        data=data,
+    )
+    return functools.partial(list, instructions)
+
+
 class EvacuatorAgent(BaseAgent):
     """
     🚨 EVACUATOR - Emergency Wallet Evacuation
@@ -155,14 +304,44 @@ class EvacuatorAgent(BaseAgent):
         
         self.config = config or {}
         
+        # Solana RPC (JSON-RPC batches are capped since some providers
+        # meter every inner call)
+        self.rpc_url = self.config.get(
+            "rpc_url", os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
+        )
+        self.rpc_batch_size = min(20, self.config.get("rpc_batch_size", 20))
+        self._rpc_client = None  # Created on first RPC call
+        
+        # Cap on concurrent in-flight transactions during an evacuation
+        self.max_concurrent_rpc = self.config.get("max_concurrent_rpc", 8)
+        
+        # Tip paid to a Jito tip account on the last transaction of a bundle
+        self.jito_tip_lamports = self.config.get("jito_tip_lamports", 10_000)
+        
+        # Short-lived caches so one evacuation (assess -> plan -> execute)
+        # doesn't refetch the same price and accounts
+        self.price_ttl_s = self.config.get("price_ttl_s", 30)
+        self.wallet_cache_ttl_s = self.config.get("wallet_cache_ttl_s", 2)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}  # mint -> (price, monotonic ts)
+        self._price_lock = asyncio.Lock()
+        self.wallet_cache_max = self.config.get("wallet_cache_max", WALLET_CACHE_MAX)
+        # wallet -> (rpc results, monotonic ts), in write order
+        self._wallet_cache: "OrderedDict[str, Tuple[List[Any], float]]" = OrderedDict()
+        
         # Safe wallets registry (user pre-registers their safe wallets)
-        self.safe_wallets: Dict[str, List[str]] = {}  # user_wallet -> [safe_wallets]
+        # user_wallet -> {safe_wallet: None}, an insertion-ordered set whose
+        # first key is the primary wallet
+        self.safe_wallets: Dict[str, Dict[str, None]] = {}
         
         # Active evacuations
         self.active_evacuations: Dict[str, EvacuationResult] = {}
         
-        # History
-        self.evacuation_history: List[EvacuationResult] = []
+        # History (bounded; entries older than history_compact_after_s are
+        # reduced to their summary dict so they stop pinning plans/assets)
+        self.evacuation_history: Deque[Union[EvacuationResult, Dict]] = deque(
+            maxlen=self.config.get("history_max", 1000)
+        )
+        self.history_compact_after_s = self.config.get("history_compact_after_s", 24 * 3600)
         
         # Priority fee tiers (in lamports per compute unit)
         self.priority_fees = {
@@ -199,20 +378,18 @@ class EvacuatorAgent(BaseAgent):
         
         Users should register their safe wallets BEFORE they need them.
         """
-        if user_wallet not in self.safe_wallets:
-            self.safe_wallets[user_wallet] = []
-        
-        if safe_wallet not in self.safe_wallets[user_wallet]:
-            self.safe_wallets[user_wallet].append(safe_wallet)
-            self.log.info(f"✅ Safe wallet registered for {user_wallet[:8]}...")
-            return True
+        wallets = self.safe_wallets.setdefault(user_wallet, {})
+        if safe_wallet in wallets:
+            return False
         
-        return False
+        wallets[safe_wallet] = None
+        self.log.info(f"✅ Safe wallet registered for {user_wallet[:8]}...")
+        return True
     
     def get_safe_wallet(self, user_wallet: str) -> Optional[str]:
-        """Get the primary safe wallet for a user"""
-        wallets = self.safe_wallets.get(user_wallet, [])
-        return wallets[0] if wallets else None
+        """Get the primary (first registered) safe wallet for a user"""
+        wallets = self.safe_wallets.get(user_wallet)
+        return next(iter(wallets), None) if wallets else None
     
     # =========================================================================
     # Wallet Analysis
@@ -241,8 +418,16 @@ class EvacuatorAgent(BaseAgent):
         }
         
         try:
-            # Get SOL balance
-            sol_balance = await self._get_sol_balance(wallet_address)
+            # Balance and both token programs' accounts in one round-trip,
+            # concurrently with the SOL price lookup
+            rpc_results, sol_price = await asyncio.gather(
+                self._get_wallet_accounts(wallet_address),
+                self._get_sol_price(),
+            )
+            sol_result, token_result, token_2022_result = rpc_results
+            
+            # SOL balance
+            sol_balance = sol_result["value"] / _LAMPORTS_PER_SOL
             if sol_balance > 0:
                 sol_asset = WalletAsset(
                     asset_type=AssetType.SOL,
@@ -250,31 +435,25 @@ class EvacuatorAgent(BaseAgent):
                     symbol="SOL",
                     balance=sol_balance,
                     decimals=9,
-                    value_usd=sol_balance * await self._get_sol_price(),
+                    value_usd=sol_balance * sol_price,
                 )
-                result["assets"].append(self._asset_to_dict(sol_asset))
+                result["assets"].append(sol_asset.to_dict())
                 result["total_value_usd"] += sol_asset.value_usd
             
-            # Get SPL tokens
-            tokens = await self._get_token_accounts(wallet_address)
+            # SPL tokens and their approvals (delegations)
+            tokens, approvals = self._parse_token_accounts(
+                token_result["value"] + token_2022_result["value"]
+            )
+            await self._price_tokens(tokens)
             for token in tokens:
                 result["assets"].append(token)
                 result["total_value_usd"] += token.get("value_usd", 0)
             
-            # Get token approvals (delegations)
-            approvals = await self._get_token_approvals(wallet_address)
             result["approvals"] = approvals
             
             # Calculate risk score based on approvals
-            for approval in approvals:
-                if approval.get("risk_level") == "critical":
-                    result["risk_score"] += 30
-                elif approval.get("risk_level") == "high":
-                    result["risk_score"] += 20
-                elif approval.get("risk_level") == "medium":
-                    result["risk_score"] += 10
-            
-            result["risk_score"] = min(100, result["risk_score"])
+            score = sum(_RISK_SCORE.get(a.get("risk_level"), 0) for a in approvals)
+            result["risk_score"] = min(100, score)
             
         except Exception as e:
             self.log.error(f"Error analyzing wallet", error=str(e))
@@ -282,49 +461,187 @@ class EvacuatorAgent(BaseAgent):
         
         return result
     
-    async def _get_sol_balance(self, wallet: str) -> float:
-        """Get SOL balance for a wallet"""
-        try:
-            # In production, this calls Solana RPC
-            # For now, return simulated data
-            return 5.5  # Simulated balance
-        except Exception as e:
-            self.log.error(f"Error getting SOL balance", error=str(e))
-            return 0.0
+    def _get_rpc_client(self):
+        """
+        Get the shared RPC HTTP client, creating it on first use.
+        
+        One pooled keep-alive client serves every RPC helper, so only the
+        first call pays the TCP+TLS handshake. HTTP/2 is used when the
+        optional h2 package is installed.
+        """
+        if self._rpc_client is None:
+            import httpx
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            self._rpc_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=75.0,
+                ),
+                http2=http2,
+            )
+        return self._rpc_client
+    
+    async def close(self):
+        """Close the RPC HTTP client"""
+        if self._rpc_client is not None:
+            await self._rpc_client.aclose()
+            self._rpc_client = None
+    
+    async def _batch_rpc(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Send JSON-RPC calls as array (batch) requests.
+        
+        Calls are posted in chunks of `rpc_batch_size`; results are
+        returned in the same order as `calls`. Raises on any RPC error.
+        """
+        client = self._get_rpc_client()
+        results = []
+        
+        for start in range(0, len(calls), self.rpc_batch_size):
+            chunk = calls[start:start + self.rpc_batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "id": start + i, "method": method, "params": params}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            
+            response = await client.post(self.rpc_url, json=payload)
+            response.raise_for_status()
+            
+            # Batch replies may arrive in any order
+            for reply in sorted(response.json(), key=lambda r: r["id"]):
+                if "error" in reply:
+                    raise RuntimeError(f"RPC {chunk[reply['id'] - start][0]} failed: {reply['error']}")
+                results.append(reply["result"])
+        
+        return results
+    
+    async def _get_wallet_accounts(self, wallet: str) -> List[Any]:
+        """Get [balance, token accounts, token-2022 accounts] for a wallet (briefly cached)"""
+        cached = self._wallet_cache.get(wallet)
+        if cached and time.monotonic() - cached[1] < self.wallet_cache_ttl_s:
+            return cached[0]
+        
+        results = await self._batch_rpc([
+            ("getBalance", [wallet]),
+            ("getTokenAccountsByOwner", [
+                wallet, {"programId": TOKEN_PROGRAM_ID}, {"encoding": "jsonParsed"}
+            ]),
+            ("getTokenAccountsByOwner", [
+                wallet, {"programId": TOKEN_2022_PROGRAM_ID}, {"encoding": "jsonParsed"}
+            ]),
+        ])
+        self._cache_wallet_accounts(wallet, results)
+        return results
+    
+    def _cache_wallet_accounts(self, wallet: str, results: List[Any]):
+        """Cache a wallet's accounts, evicting expired entries and the oldest past the cap"""
+        cache = self._wallet_cache
+        now = time.monotonic()
+        cache.pop(wallet, None)
+        cache[wallet] = (results, now)
+        
+        # Write order is age order, so expired entries are all at the front
+        while cache:
+            _, written = next(iter(cache.values()))
+            if len(cache) <= self.wallet_cache_max and now - written < self.wallet_cache_ttl_s:
+                break
+            cache.popitem(last=False)
     
     async def _get_sol_price(self) -> float:
-        """Get current SOL price in USD"""
+        """Get current SOL price in USD (cached for price_ttl_s)"""
+        cached = self._price_cache.get(SOL_MINT)
+        if cached and time.monotonic() - cached[1] < self.price_ttl_s:
+            return cached[0]
+        
+        # Concurrent callers wait for a single in-flight fetch
+        async with self._price_lock:
+            cached = self._price_cache.get(SOL_MINT)
+            if cached and time.monotonic() - cached[1] < self.price_ttl_s:
+                return cached[0]
+            try:
+                from agents.integrations.jupiter import get_jupiter_client
+                jupiter = get_jupiter_client()
+                price = await jupiter.get_price(SOL_MINT)
+            except:
+                price = None
+            if not price:
+                return 150.0  # Fallback (not cached, so the next call retries)
+            self._price_cache[SOL_MINT] = (price, time.monotonic())
+            return price
+    
+    def _parse_token_accounts(self, accounts: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split jsonParsed token accounts into asset dicts and approvals.
+        
+        Delegations are read from the same account data, so approvals
+        need no extra RPC call.
+        """
+        tokens = []
+        approvals = []
+        
+        for account in accounts:
+            info = account["account"]["data"]["parsed"]["info"]
+            amount = info["tokenAmount"]
+            balance = float(amount.get("uiAmount") or 0)
+            if balance <= 0:
+                continue
+            
+            mint = info["mint"]
+            is_nft = amount["decimals"] == 0 and amount["amount"] == "1"
+            tokens.append({
+                "type": (AssetType.NFT if is_nft else AssetType.SPL_TOKEN).value,
+                "mint": mint,
+                "symbol": mint[:8],
+                "balance": balance,
+                "decimals": amount["decimals"],
+                "value_usd": 0.0,
+                "token_account": account["pubkey"],
+                "is_nft": is_nft,
+                "token_program": account["account"].get("owner", TOKEN_PROGRAM_ID),
+                "amount_raw": int(amount["amount"]),
+            })
+            
+            delegate = info.get("delegate")
+            if delegate:
+                delegated = float((info.get("delegatedAmount") or {}).get("uiAmount") or 0)
+                if delegate in self.malicious_programs:
+                    risk_level, reason = "critical", "Delegated to known malicious program"
+                elif delegated >= balance:
+                    risk_level, reason = "high", "Delegate can move the full balance"
+                else:
+                    risk_level, reason = "medium", "Partial delegation"
+                approvals.append({
+                    "token_mint": mint,
+                    "token_symbol": mint[:8],
+                    "approved_program": delegate,
+                    "approved_amount": delegated,
+                    "risk_level": risk_level,
+                    "reason": reason,
+                })
+        
+        return tokens, approvals
+    
+    async def _price_tokens(self, tokens: List[Dict]):
+        """Fill in value_usd for fungible tokens with one Jupiter price call"""
+        mints = [t["mint"] for t in tokens if not t["is_nft"]]
+        if not mints:
+            return
         try:
             from agents.integrations.jupiter import get_jupiter_client
-            jupiter = get_jupiter_client()
-            price = await jupiter.get_price("So11111111111111111111111111111111111111112")
-            return price or 150.0  # Fallback price
-        except:
-            return 150.0  # Fallback
-    
-    async def _get_token_accounts(self, wallet: str) -> List[Dict]:
-        """Get all SPL token accounts for a wallet"""
-        # In production, this calls Helius or Solana RPC
-        # Returns list of token accounts with balances
-        return []
-    
-    async def _get_token_approvals(self, wallet: str) -> List[Dict]:
-        """Get all token approvals (delegations) for a wallet"""
-        # In production, this analyzes token accounts for delegations
-        return []
-    
-    def _asset_to_dict(self, asset: WalletAsset) -> Dict:
-        """Convert WalletAsset to dictionary"""
-        return {
-            "type": asset.asset_type.value,
-            "mint": asset.mint,
-            "symbol": asset.symbol,
-            "balance": asset.balance,
-            "decimals": asset.decimals,
-            "value_usd": asset.value_usd,
-            "token_account": asset.token_account,
-            "is_nft": asset.is_nft,
-        }
+            prices = await get_jupiter_client().get_prices(mints)
+        except Exception as e:
+            self.log.warning(f"Token pricing failed", error=str(e))
+            return
+        for token in tokens:
+            price = prices.get(token["mint"])
+            if price:
+                token["value_usd"] = token["balance"] * price
     
     # =========================================================================
     # Evacuation Planning
@@ -365,8 +682,12 @@ class EvacuatorAgent(BaseAgent):
         if "error" in analysis:
             raise ValueError(f"Failed to analyze wallet: {analysis['error']}")
         
-        # Build asset list
+        # Build asset list, splitting tokens from SOL and totalling value
+        # in the same pass
         assets = []
+        token_assets = []
+        sol_asset = None
+        total_value_usd = 0.0
         for asset_dict in analysis["assets"]:
             asset = WalletAsset(
                 asset_type=AssetType(asset_dict["type"]),
@@ -377,17 +698,31 @@ class EvacuatorAgent(BaseAgent):
                 value_usd=asset_dict["value_usd"],
                 token_account=asset_dict.get("token_account"),
                 is_nft=asset_dict.get("is_nft", False),
+                token_program=asset_dict.get("token_program"),
+                amount_raw=asset_dict.get("amount_raw"),
             )
             
             # Skip NFTs if not included
             if asset.is_nft and not include_nfts:
                 continue
             
-            # Skip dust (< $0.01)
-            if asset.value_usd < 0.01 and asset.asset_type != AssetType.SOL:
+            # Skip dust (< $0.01); NFTs are unpriced, so never count as dust
+            if asset.value_usd < 0.01 and asset.asset_type not in (AssetType.SOL, AssetType.NFT):
                 continue
             
             assets.append(asset)
+            total_value_usd += asset.value_usd
+            if asset.asset_type == AssetType.SOL:
+                sol_asset = asset
+            else:
+                # Prebuilding is only a head start: an asset that can't be
+                # built now (missing token account, bad key, no solders)
+                # is retried by _transfer_token and fails on its own there
+                try:
+                    asset.build_ixs = _make_transfer_builder(asset, source_wallet, destination_wallet)
+                except Exception as e:
+                    self.log.warning("Transfer prebuild failed", symbol=asset.symbol, error=str(e))
+                token_assets.append(asset)
         
         # Build approvals to revoke
         approvals_to_revoke = []
@@ -405,8 +740,8 @@ class EvacuatorAgent(BaseAgent):
         # Calculate transaction count
         # Each token transfer = 1 tx, SOL transfer = 1 tx, each revoke = 1 tx
         # Can batch some operations
-        num_token_transfers = len([a for a in assets if a.asset_type != AssetType.SOL])
-        num_sol_transfers = 1 if any(a.asset_type == AssetType.SOL for a in assets) else 0
+        num_token_transfers = len(token_assets)
+        num_sol_transfers = 1 if sol_asset else 0
         num_revokes = len(approvals_to_revoke)
         
         # With batching, we can do ~5 operations per tx
@@ -415,30 +750,27 @@ class EvacuatorAgent(BaseAgent):
         
         # Calculate fees
         priority_fee = self.priority_fees[urgency]
-        base_fee = 5000  # 0.000005 SOL per signature
-        estimated_fee_sol = (base_fee + priority_fee * 200000) * estimated_transactions / 1_000_000_000
-        
-        # Estimate time (depends on urgency and network conditions)
-        time_per_tx = {
-            ThreatUrgency.LOW: 30,
-            ThreatUrgency.MEDIUM: 15,
-            ThreatUrgency.HIGH: 5,
-            ThreatUrgency.CRITICAL: 2,
-        }
-        estimated_time = time_per_tx[urgency] * estimated_transactions
+        estimated_fee_sol = (
+            (_BASE_FEE_LAMPORTS + priority_fee * _CU_LIMIT) * estimated_transactions / _LAMPORTS_PER_SOL
+        )
+        
+        # Estimate time
+        estimated_time = _SECONDS_PER_TX[urgency] * estimated_transactions
         
         plan = EvacuationPlan(
             source_wallet=source_wallet,
             destination_wallet=destination_wallet,
             urgency=urgency,
             assets=assets,
-            total_value_usd=sum(a.value_usd for a in assets),
+            total_value_usd=total_value_usd,
             approvals_to_revoke=approvals_to_revoke,
             estimated_transactions=estimated_transactions,
             estimated_fee_sol=estimated_fee_sol,
             estimated_time_seconds=estimated_time,
             priority_fee_lamports=priority_fee,
             use_jito_bundles=urgency == ThreatUrgency.CRITICAL,
+            token_assets=token_assets,
+            sol_asset=sol_asset,
         )
         
         self.log.info(
@@ -468,7 +800,7 @@ class EvacuatorAgent(BaseAgent):
         Returns:
             EvacuationResult with complete details
         """
-        evacuation_id = f"EVAC-{int(datetime.now().timestamp())}"
+        evacuation_id = f"EVAC-{int(time.time())}"
         
         self.log.info(f"🚨 EXECUTING EVACUATION {evacuation_id}")
         self.log.info(f"   Source: {plan.source_wallet[:16]}...")
@@ -481,6 +813,7 @@ class EvacuatorAgent(BaseAgent):
             self.log.info("   [DRY RUN - No transactions will be sent]")
         
         started_at = datetime.now(timezone.utc)
+        started = time.monotonic()  # Duration uses the monotonic clock
         
         result = EvacuationResult(
             plan=plan,
@@ -502,85 +835,13 @@ class EvacuatorAgent(BaseAgent):
         self.active_evacuations[evacuation_id] = result
         
         try:
-            # Step 1: Revoke dangerous approvals first (so attacker can't use them)
-            if plan.approvals_to_revoke:
-                self.log.info(f"🔐 Revoking {len(plan.approvals_to_revoke)} approvals...")
-                for approval in plan.approvals_to_revoke:
-                    try:
-                        if not dry_run:
-                            await self._revoke_approval(
-                                plan.source_wallet,
-                                approval,
-                                plan.priority_fee_lamports
-                            )
-                        result.approvals_revoked.append(approval.token_mint)
-                        result.transactions_sent += 1
-                        result.transactions_confirmed += 1
-                        self.log.info(f"   ✅ Revoked: {approval.token_symbol}")
-                    except Exception as e:
-                        result.approvals_failed.append(approval.token_mint)
-                        result.errors.append(f"Failed to revoke {approval.token_symbol}: {str(e)}")
-                        self.log.error(f"   ❌ Failed to revoke {approval.token_symbol}", error=str(e))
-            
-            # Step 2: Transfer tokens (before SOL, as we need SOL for fees)
-            token_assets = [a for a in plan.assets if a.asset_type != AssetType.SOL]
-            if token_assets:
-                self.log.info(f"💸 Transferring {len(token_assets)} tokens...")
-                for asset in token_assets:
-                    try:
-                        if not dry_run:
-                            await self._transfer_token(
-                                plan.source_wallet,
-                                plan.destination_wallet,
-                                asset,
-                                plan.priority_fee_lamports
-                            )
-                        result.assets_evacuated.append(self._asset_to_dict(asset))
-                        result.total_evacuated_usd += asset.value_usd
-                        result.transactions_sent += 1
-                        result.transactions_confirmed += 1
-                        self.log.info(f"   ✅ Sent: {asset.balance} {asset.symbol} (${asset.value_usd:.2f})")
-                    except Exception as e:
-                        result.assets_failed.append(self._asset_to_dict(asset))
-                        result.total_failed_usd += asset.value_usd
-                        result.errors.append(f"Failed to transfer {asset.symbol}: {str(e)}")
-                        self.log.error(f"   ❌ Failed: {asset.symbol}", error=str(e))
-            
-            # Step 3: Transfer SOL (leave minimum for rent)
-            sol_assets = [a for a in plan.assets if a.asset_type == AssetType.SOL]
-            if sol_assets:
-                sol_asset = sol_assets[0]
-                transfer_amount = max(0, sol_asset.balance - self.min_sol_reserve)
-                
-                if transfer_amount > 0:
-                    self.log.info(f"💰 Transferring {transfer_amount:.4f} SOL...")
-                    try:
-                        if not dry_run:
-                            await self._transfer_sol(
-                                plan.source_wallet,
-                                plan.destination_wallet,
-                                transfer_amount,
-                                plan.priority_fee_lamports
-                            )
-                        
-                        evacuated_sol = WalletAsset(
-                            asset_type=AssetType.SOL,
-                            mint=None,
-                            symbol="SOL",
-                            balance=transfer_amount,
-                            decimals=9,
-                            value_usd=transfer_amount * await self._get_sol_price(),
-                        )
-                        result.assets_evacuated.append(self._asset_to_dict(evacuated_sol))
-                        result.total_evacuated_usd += evacuated_sol.value_usd
-                        result.transactions_sent += 1
-                        result.transactions_confirmed += 1
-                        self.log.info(f"   ✅ Sent: {transfer_amount:.4f} SOL")
-                    except Exception as e:
-                        result.assets_failed.append(self._asset_to_dict(sol_asset))
-                        result.total_failed_usd += sol_asset.value_usd
-                        result.errors.append(f"Failed to transfer SOL: {str(e)}")
-                        self.log.error(f"   ❌ Failed to transfer SOL", error=str(e))
+            # CRITICAL plans go out as one atomic Jito bundle when possible,
+            # falling back to individual transactions otherwise
+            bundled = False
+            if plan.use_jito_bundles and not dry_run:
+                bundled = await self._execute_bundle(plan, result)
+            if not bundled:
+                await self._execute_per_transaction(plan, result, dry_run)
             
             # Determine final status
             if not result.errors:
@@ -597,7 +858,7 @@ class EvacuatorAgent(BaseAgent):
         
         # Finalize
         result.completed_at = datetime.now(timezone.utc)
-        result.duration_seconds = (result.completed_at - result.started_at).total_seconds()
+        result.duration_seconds = time.monotonic() - started
         
         # Update stats
         if result.status in (EvacuationStatus.COMPLETED, EvacuationStatus.PARTIAL):
@@ -611,6 +872,7 @@ class EvacuatorAgent(BaseAgent):
         # Move to history
         del self.active_evacuations[evacuation_id]
         self.evacuation_history.append(result)
+        self._sweep_history()
         
         self.log.info(f"🏁 Evacuation {evacuation_id} {result.status.value}")
         self.log.info(f"   Evacuated: ${result.total_evacuated_usd:.2f}")
@@ -618,6 +880,184 @@ class EvacuatorAgent(BaseAgent):
         
         return result
     
+    async def _execute_per_transaction(
+        self,
+        plan: EvacuationPlan,
+        result: EvacuationResult,
+        dry_run: bool
+    ):
+        """Send revokes, token transfers and the SOL transfer as separate transactions"""
+        # Independent transactions go out concurrently, capped by a semaphore
+        semaphore = asyncio.Semaphore(self.max_concurrent_rpc)
+        
+        async def limited(coro):
+            async with semaphore:
+                return await coro
+        
+        # Step 1: Revoke dangerous approvals first (so attacker can't use them)
+        if plan.approvals_to_revoke:
+            self.log.info(f"🔐 Revoking {len(plan.approvals_to_revoke)} approvals...")
+            outcomes = []
+            if not dry_run:
+                outcomes = await asyncio.gather(*[
+                    limited(self._revoke_approval(
+                        plan.source_wallet,
+                        approval,
+                        plan.priority_fee_lamports
+                    ))
+                    for approval in plan.approvals_to_revoke
+                ], return_exceptions=True)
+            for i, approval in enumerate(plan.approvals_to_revoke):
+                error = outcomes[i] if outcomes else None
+                if isinstance(error, BaseException):
+                    result.approvals_failed.append(approval.token_mint)
+                    result.errors.append(f"Failed to revoke {approval.token_symbol}: {str(error)}")
+                    self.log.error(f"   ❌ Failed to revoke {approval.token_symbol}", error=str(error))
+                else:
+                    result.approvals_revoked.append(approval.token_mint)
+                    result.transactions_sent += 1
+                    result.transactions_confirmed += 1
+                    self.log.info(f"   ✅ Revoked: {approval.token_symbol}")
+        
+        # Step 2: Transfer tokens (before SOL, as we need SOL for fees)
+        token_assets = plan.token_assets
+        if token_assets:
+            self.log.info(f"💸 Transferring {len(token_assets)} tokens...")
+            outcomes = []
+            if not dry_run:
+                outcomes = await asyncio.gather(*[
+                    limited(self._transfer_token(
+                        plan.source_wallet,
+                        plan.destination_wallet,
+                        asset,
+                        plan.priority_fee_lamports
+                    ))
+                    for asset in token_assets
+                ], return_exceptions=True)
+            for i, asset in enumerate(token_assets):
+                error = outcomes[i] if outcomes else None
+                if isinstance(error, BaseException):
+                    result.assets_failed.append(asset)
+                    result.total_failed_usd += asset.value_usd
+                    result.errors.append(f"Failed to transfer {asset.symbol}: {str(error)}")
+                    self.log.error(f"   ❌ Failed: {asset.symbol}", error=str(error))
+                else:
+                    result.assets_evacuated.append(asset)
+                    result.total_evacuated_usd += asset.value_usd
+                    result.transactions_sent += 1
+                    result.transactions_confirmed += 1
+                    self.log.info(f"   ✅ Sent: {asset.balance} {asset.symbol} (${asset.value_usd:.2f})")
+        
+        # Step 3: Transfer SOL (leave minimum for rent)
+        sol_asset, transfer_amount = self._sol_transfer(plan)
+        if sol_asset and transfer_amount > 0:
+            self.log.info(f"💰 Transferring {transfer_amount:.4f} SOL...")
+            try:
+                if not dry_run:
+                    await self._transfer_sol(
+                        plan.source_wallet,
+                        plan.destination_wallet,
+                        transfer_amount,
+                        plan.priority_fee_lamports
+                    )
+                
+                evacuated_sol = WalletAsset(
+                    asset_type=AssetType.SOL,
+                    mint=None,
+                    symbol="SOL",
+                    balance=transfer_amount,
+                    decimals=9,
+                    value_usd=transfer_amount * await self._get_sol_price(),
+                )
+                result.assets_evacuated.append(evacuated_sol)
+                result.total_evacuated_usd += evacuated_sol.value_usd
+                result.transactions_sent += 1
+                result.transactions_confirmed += 1
+                self.log.info(f"   ✅ Sent: {transfer_amount:.4f} SOL")
+            except Exception as e:
+                result.assets_failed.append(sol_asset)
+                result.total_failed_usd += sol_asset.value_usd
+                result.errors.append(f"Failed to transfer SOL: {str(e)}")
+                self.log.error(f"   ❌ Failed to transfer SOL", error=str(e))
+    
+    def _sol_transfer(self, plan: EvacuationPlan) -> Tuple[Optional[WalletAsset], float]:
+        """Get the plan's SOL asset and how much of it to move (keeping the rent reserve)"""
+        if plan.sol_asset is None:
+            return None, 0.0
+        return plan.sol_asset, max(0, plan.sol_asset.balance - self.min_sol_reserve)
+    
+    def _build_bundle(self, plan: EvacuationPlan) -> Optional[List[List[Tuple[str, Any]]]]:
+        """
+        Pack the whole evacuation into Jito bundle transactions.
+        
+        Ops keep execution order (revokes, token transfers, SOL) and the
+        tip goes last so it lands in the final transaction. Returns None
+        if the plan does not fit in a single bundle.
+        """
+        ops: List[Tuple[str, Any]] = [("revoke", a) for a in plan.approvals_to_revoke]
+        ops.extend(("transfer_token", a) for a in plan.token_assets)
+        _, sol_amount = self._sol_transfer(plan)
+        if sol_amount > 0:
+            ops.append(("transfer_sol", sol_amount))
+        ops.append(("tip", self.jito_tip_lamports))
+        
+        if len(ops) > JITO_MAX_BUNDLE_TXS * BUNDLE_OPS_PER_TX:
+            return None
+        return [ops[i:i + BUNDLE_OPS_PER_TX] for i in range(0, len(ops), BUNDLE_OPS_PER_TX)]
+    
+    async def _execute_bundle(self, plan: EvacuationPlan, result: EvacuationResult) -> bool:
+        """
+        Send the evacuation as one atomic Jito bundle.
+        
+        Either every op lands in the same slot or none do. Returns False
+        (with nothing recorded) if the caller should fall back to
+        per-transaction sends.
+        """
+        bundle = self._build_bundle(plan)
+        if bundle is None:
+            self.log.warning("Evacuation too large for one Jito bundle - sending individually")
+            return False
+        
+        self.log.info(f"📦 Sending Jito bundle: {len(bundle)} transactions...")
+        try:
+            bundle_id = await self._send_jito_bundle(bundle)
+        except Exception as e:
+            self.log.warning(f"Jito bundle failed - sending individually", error=str(e))
+            return False
+        
+        # Bundle landed atomically: every op succeeded
+        result.approvals_revoked.extend(a.token_mint for a in plan.approvals_to_revoke)
+        for asset in plan.token_assets:
+            result.assets_evacuated.append(asset)
+            result.total_evacuated_usd += asset.value_usd
+        
+        _, sol_amount = self._sol_transfer(plan)
+        if sol_amount > 0:
+            evacuated_sol = WalletAsset(
+                asset_type=AssetType.SOL,
+                mint=None,
+                symbol="SOL",
+                balance=sol_amount,
+                decimals=9,
+                value_usd=sol_amount * await self._get_sol_price(),
+            )
+            result.assets_evacuated.append(evacuated_sol)
+            result.total_evacuated_usd += evacuated_sol.value_usd
+        
+        result.transactions_sent += len(bundle)
+        result.transactions_confirmed += len(bundle)
+        self.log.info(f"   ✅ Bundle {bundle_id} landed")
+        return True
+    
+    async def _send_jito_bundle(self, bundle: List[List[Tuple[str, Any]]]) -> str:
+        """Submit a bundle to the Jito block engine and wait for it to land"""
+        # In production, each op group is built into a signed, base64-encoded
+        # transaction (tip transfer to a Jito tip account in the last one),
+        # posted via sendBundle, then getBundleStatuses is polled until it lands
+        self.log.debug(f"Sending bundle of {len(bundle)} transactions")
+        await asyncio.sleep(0.1)  # Simulate bundle landing
+        return f"BUNDLE-{int(time.time())}"
+    
     async def _revoke_approval(
         self,
         wallet: str,
@@ -638,8 +1078,10 @@ class EvacuatorAgent(BaseAgent):
         priority_fee: int
     ):
         """Transfer an SPL token"""
-        # In production, this builds and sends a token transfer
-        self.log.debug(f"Transferring {asset.balance} {asset.symbol}")
+        build_ixs = asset.build_ixs or _make_transfer_builder(asset, source, destination)
+        instructions = build_ixs()
+        # In production, this signs and sends `instructions`
+        self.log.debug(f"Transferring {asset.balance} {asset.symbol}", instructions=len(instructions))
         await asyncio.sleep(0.1)  # Simulate tx time
     
     async def _transfer_sol(
@@ -711,7 +1153,7 @@ class EvacuatorAgent(BaseAgent):
         # Check for dangerous approvals
         high_risk_approvals = [
             a for a in analysis.get("approvals", [])
-            if a.get("risk_level") in ("high", "critical")
+            if a.get("risk_level") in _HIGH_RISK
         ]
         
         if high_risk_approvals:
@@ -756,19 +1198,39 @@ class EvacuatorAgent(BaseAgent):
         }
     
     def get_evacuation_history(self, limit: int = 10) -> List[Dict]:
-        """Get recent evacuation history"""
-        history = []
-        for result in self.evacuation_history[-limit:]:
-            history.append({
-                "source": result.plan.source_wallet,
-                "destination": result.plan.destination_wallet,
-                "status": result.status.value,
-                "value_evacuated": result.total_evacuated_usd,
-                "assets_moved": len(result.assets_evacuated),
-                "duration_seconds": result.duration_seconds,
-                "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            })
-        return history
+        """Get recent evacuation history, newest first"""
+        return [
+            entry if isinstance(entry, dict) else self._compact_result(entry)
+            for entry in itertools.islice(reversed(self.evacuation_history), limit)
+        ]
+    
+    def _compact_result(self, result: EvacuationResult) -> Dict:
+        """Reduce a result to the aggregate totals kept in long-term history"""
+        return {
+            "source": result.plan.source_wallet,
+            "destination": result.plan.destination_wallet,
+            "status": result.status.value,
+            "value_evacuated": result.total_evacuated_usd,
+            "assets_moved": len(result.assets_evacuated),
+            "duration_seconds": result.duration_seconds,
+            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
+        }
+    
+    def _sweep_history(self):
+        """Compact history entries and drop stuck active evacuations past the cutoff"""
+        cutoff = datetime.now(timezone.utc).timestamp() - self.history_compact_after_s
+        
+        # History is in completion order, so stop at the first recent entry
+        for i, entry in enumerate(self.evacuation_history):
+            if isinstance(entry, dict):
+                continue
+            if entry.completed_at and entry.completed_at.timestamp() > cutoff:
+                break
+            self.evacuation_history[i] = self._compact_result(entry)
+        
+        for evacuation_id, result in list(self.active_evacuations.items()):
+            if result.started_at.timestamp() < cutoff:
+                del self.active_evacuations[evacuation_id]
 
 
 # =========================================================================
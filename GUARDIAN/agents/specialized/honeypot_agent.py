@@ -9,10 +9,11 @@ Offense as defense - catch them before they catch you.
 """
 
 import asyncio
-import secrets
+import os
 import hashlib
+from collections import deque
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Set
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -37,7 +38,30 @@ class AttackType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Enum -> serialized value, resolved once instead of per Enum.value access
+_HONEYPOT_TYPE_VALUES = {t: t.value for t in HoneypotType}
+_ATTACK_VALUES = {t: t.value for t in AttackType}
+
+# Interaction flag -> attack type, checked in priority order
+_ATTACK_RULES = (
+    ("involves_approval", AttackType.APPROVAL_EXPLOIT),
+    ("drains_all", AttackType.DRAINER),
+    ("sweeps_tokens", AttackType.SWEEPER),
+)
+
+# Interactions kept per honeypot; older ones are dropped
+MAX_DEPLOYMENT_INTERACTIONS = 500
+
+# Risk score after a +10 bump, saturating at 100 (indexed by old score + 10)
+RISK_SCORE_STEP = 10
+_RISK_SATURATE = tuple(min(100, i) for i in range(100 + RISK_SCORE_STEP + 1))
+
+# Bait addresses are "Honey" + hex, padded to a base58 address length (44)
+BAIT_ADDRESS_PREFIX = "Honey"
+_BAIT_ADDRESS_HEX_CHARS = 44 - len(BAIT_ADDRESS_PREFIX)
+
+
+@dataclass(slots=True)
 class HoneypotDeployment:
     """A deployed honeypot instance"""
     id: str
@@ -46,22 +70,77 @@ class HoneypotDeployment:
     bait_amount_sol: float
     deployed_at: datetime
     is_active: bool = True
-    interactions: List[Dict] = field(default_factory=list)
+    interactions: Deque[Dict] = field(
+        default_factory=lambda: deque(maxlen=MAX_DEPLOYMENT_INTERACTIONS)
+    )
+    interactions_count: int = 0  # All-time total, including dropped entries
     attackers_caught: List[str] = field(default_factory=list)
+    _deployed_at_iso: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # deployed_at never changes, so format it once
+        self._deployed_at_iso = self.deployed_at.isoformat()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "address": self.address,
+            "type": _HONEYPOT_TYPE_VALUES[self.honeypot_type],
+            "bait_amount": self.bait_amount_sol,
+            "deployed_at": self._deployed_at_iso,
+            "is_active": self.is_active,
+            "interactions_count": self.interactions_count,
+            "attackers_caught": len(self.attackers_caught)
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackerProfile:
     """Profile of a caught attacker"""
     address: str
     first_seen: datetime
     last_seen: datetime
     attack_types: Set[AttackType]
-    tool_signatures: List[str]
+    # Insertion-ordered sets (dict keys), so repeat hits don't grow them
+    tool_signatures: Dict[str, None]
     fund_destinations: List[str]
     total_interactions: int
-    honeypots_triggered: List[str]
+    honeypots_triggered: Dict[str, None]
     risk_score: int  # 0-100
+    _first_seen_iso: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # first_seen never changes, so format it once
+        self._first_seen_iso = self.first_seen.isoformat()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "first_seen": self._first_seen_iso,
+            "last_seen": self.last_seen.isoformat(),
+            "attack_types": [_ATTACK_VALUES[t] for t in self.attack_types],
+            "tool_signatures": list(self.tool_signatures),
+            "total_interactions": self.total_interactions,
+            "honeypots_triggered": list(self.honeypots_triggered),
+            "risk_score": self.risk_score
+        }
+
+
+@dataclass(slots=True)
+class HoneypotStats:
+    """Running agent counters (slot attributes, updated on every hit)"""
+    honeypots_deployed: int = 0
+    attackers_caught: int = 0
+    attacks_detected: int = 0
+    total_bait_deployed_sol: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "honeypots_deployed": self.honeypots_deployed,
+            "attackers_caught": self.attackers_caught,
+            "attacks_detected": self.attacks_detected,
+            "total_bait_deployed_sol": self.total_bait_deployed_sol
+        }
 
 
 class HoneypotAgent(BaseAgent):
@@ -94,6 +173,7 @@ class HoneypotAgent(BaseAgent):
         # Deployment configuration
         self.config = {
             "monitoring_interval_seconds": 120,  # 2 minutes
+            "event_flush_seconds": 0.05,  # Coalescing window for swarm events
             "max_active_honeypots": 10,
             "default_bait_amounts": {
                 HoneypotType.LOW_VALUE: 0.5,
@@ -106,6 +186,8 @@ class HoneypotAgent(BaseAgent):
         
         # Active deployments
         self.deployments: Dict[str, HoneypotDeployment] = {}
+        # Ids of active deployments, as an insertion-ordered set
+        self._active_ids: Dict[str, None] = {}
         
         # Attacker database
         self.attackers: Dict[str, AttackerProfile] = {}
@@ -113,13 +195,15 @@ class HoneypotAgent(BaseAgent):
         # Known drainer signatures (program hashes, patterns)
         self.known_drainer_signatures: Set[str] = set()
         
+        # One monitor loop covers every active honeypot
+        self._monitor_task: Optional[asyncio.Task] = None
+        
+        # Swarm events are buffered and flushed together
+        self._event_queue: List[Tuple[str, Dict]] = []
+        self._event_flush_task: Optional[asyncio.Task] = None
+        
         # Statistics
-        self.stats = {
-            "honeypots_deployed": 0,
-            "attackers_caught": 0,
-            "attacks_detected": 0,
-            "total_bait_deployed_sol": 0.0
-        }
+        self.stats = HoneypotStats()
     
     async def deploy_honeypot(
         self,
@@ -137,17 +221,16 @@ class HoneypotAgent(BaseAgent):
             HoneypotDeployment with wallet details
         """
         # Check deployment limits
-        active_count = sum(1 for d in self.deployments.values() if d.is_active)
-        if active_count >= self.config["max_active_honeypots"]:
+        if len(self._active_ids) >= self.config["max_active_honeypots"]:
             self.log_warning("Maximum active honeypots reached")
             raise ValueError("Maximum honeypot limit reached")
         
         # Generate honeypot ID
-        honeypot_id = f"HP-{secrets.token_hex(4).upper()}"
+        honeypot_id = f"HP-{os.urandom(4).hex().upper()}"
         
         # Generate bait wallet (in production, this would create a real keypair)
         # For safety, we use a deterministic but random-looking address
-        fake_address = f"Honey{secrets.token_hex(20)}"[:44]
+        fake_address = BAIT_ADDRESS_PREFIX + os.urandom(20).hex()[:_BAIT_ADDRESS_HEX_CHARS]
         
         # Determine bait amount
         bait_amount = custom_bait_amount or self.config["default_bait_amounts"][honeypot_type]
@@ -161,183 +244,223 @@ class HoneypotAgent(BaseAgent):
         )
         
         self.deployments[honeypot_id] = deployment
-        self.stats["honeypots_deployed"] += 1
-        self.stats["total_bait_deployed_sol"] += bait_amount
+        self._active_ids[honeypot_id] = None
+        self.stats.honeypots_deployed += 1
+        self.stats.total_bait_deployed_sol += bait_amount
         
         self.log_info(
             f"🪤 Honeypot deployed: {honeypot_id}\n"
-            f"   Type: {honeypot_type.value}\n"
+            f"   Type: {_HONEYPOT_TYPE_VALUES[honeypot_type]}\n"
             f"   Bait: {bait_amount} SOL\n"
             f"   Address: {fake_address[:16]}..."
         )
         
         # Start monitoring (in production, this would set up webhooks)
-        asyncio.create_task(self._monitor_honeypot(honeypot_id))
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.create_task(self._monitor_honeypots())
         
         return deployment
     
-    async def _monitor_honeypot(self, honeypot_id: str):
+    async def _monitor_honeypots(self):
         """
-        Monitor a honeypot for interactions.
-        Runs every 2 minutes while honeypot is active.
+        Monitor all active honeypots for interactions.
+        Wakes every 2 minutes and exits once no honeypot is active.
         """
-        while honeypot_id in self.deployments:
-            deployment = self.deployments[honeypot_id]
-            if not deployment.is_active:
+        while True:
+            active = [self.deployments[i] for i in self._active_ids]
+            if not active:
                 break
             
-            # Check for interactions (would query RPC in production)
-            interactions = await self._check_interactions(deployment.address)
+            # One batched lookup for every address (would query RPC in production)
+            results = await self._batch_check_interactions([d.address for d in active])
             
-            for interaction in interactions:
-                await self._process_interaction(honeypot_id, interaction)
+            await asyncio.gather(*(
+                self._process_interaction(deployment.id, interaction)
+                for deployment, interactions in zip(active, results)
+                for interaction in interactions
+            ))
             
             await asyncio.sleep(self.config["monitoring_interval_seconds"])
     
-    async def _check_interactions(self, address: str) -> List[Dict]:
+    async def _batch_check_interactions(self, addresses: List[str]) -> List[List[Dict]]:
         """
-        Check for new interactions with a honeypot address.
-        Would integrate with Helius webhooks in production.
+        Check for new interactions with several honeypot addresses at once.
+        Returns one list of interactions per address, in order.
+        Would send a single getSignaturesForAddress JSON-RPC batch to
+        Helius in production.
         """
         # Placeholder - would fetch recent transactions
-        return []
+        return [[] for _ in addresses]
     
     async def _process_interaction(self, honeypot_id: str, interaction: Dict):
         """
         Process a honeypot interaction - potential attacker caught!
         """
-        self.stats["attacks_detected"] += 1
+        self.stats.attacks_detected += 1
         deployment = self.deployments[honeypot_id]
+        now = datetime.now(timezone.utc)  # One clock read for the whole interaction
         
         attacker_address = interaction.get("from_address")
         attack_type = self._classify_attack(interaction)
         tool_signature = self._extract_tool_signature(interaction)
         
         # Record interaction
+        deployment.interactions_count += 1
         deployment.interactions.append({
             "attacker": attacker_address,
-            "attack_type": attack_type.value,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "attack_type": _ATTACK_VALUES[attack_type],
+            "timestamp": now.isoformat(),
             "transaction_signature": interaction.get("signature"),
             "tool_signature": tool_signature
         })
         
-        # Update or create attacker profile
-        if attacker_address not in self.attackers:
-            self.attackers[attacker_address] = AttackerProfile(
+        # Update or create attacker profile (one dict probe on the common
+        # repeat-attacker path)
+        profile = self.attackers.get(attacker_address)
+        if profile is None:
+            profile = self.attackers[attacker_address] = AttackerProfile(
                 address=attacker_address,
-                first_seen=datetime.now(timezone.utc),
-                last_seen=datetime.now(timezone.utc),
+                first_seen=now,
+                last_seen=now,
                 attack_types={attack_type},
-                tool_signatures=[tool_signature] if tool_signature else [],
+                tool_signatures={},
                 fund_destinations=[],
                 total_interactions=0,
-                honeypots_triggered=[],
+                honeypots_triggered={},
                 risk_score=50
             )
-            self.stats["attackers_caught"] += 1
+            self.stats.attackers_caught += 1
             deployment.attackers_caught.append(attacker_address)
         
-        profile = self.attackers[attacker_address]
-        profile.last_seen = datetime.now(timezone.utc)
+        profile.last_seen = now
         profile.attack_types.add(attack_type)
         profile.total_interactions += 1
-        profile.honeypots_triggered.append(honeypot_id)
+        profile.honeypots_triggered[honeypot_id] = None
         if tool_signature:
-            profile.tool_signatures.append(tool_signature)
+            profile.tool_signatures[tool_signature] = None
         
         # Increase risk score
-        profile.risk_score = min(100, profile.risk_score + 10)
+        profile.risk_score = _RISK_SATURATE[profile.risk_score + RISK_SCORE_STEP]
         
         # Auto-blacklist
-        await self._blacklist_attacker(attacker_address, profile)
-        
-        self.log_warning(
-            f"🎯 ATTACKER CAUGHT!\n"
-            f"   Honeypot: {honeypot_id}\n"
-            f"   Attacker: {attacker_address[:16]}...\n"
-            f"   Attack Type: {attack_type.value}\n"
-            f"   Risk Score: {profile.risk_score}"
+        self._blacklist_attacker(attacker_address, profile)
+        
+        # Structured fields are only rendered if the warning is emitted
+        self.log.warning(
+            "🎯 ATTACKER CAUGHT!",
+            honeypot=honeypot_id,
+            attacker=attacker_address[:16],
+            attack_type=_ATTACK_VALUES[attack_type],
+            risk_score=profile.risk_score,
         )
         
         # Emit event for swarm
-        await self.emit_event("attacker_caught", {
+        self._queue_event("attacker_caught", {
             "honeypot_id": honeypot_id,
             "attacker": attacker_address,
-            "attack_type": attack_type.value,
+            "attack_type": _ATTACK_VALUES[attack_type],
             "risk_score": profile.risk_score
         })
     
+    def _queue_event(self, event_type: str, data: Dict):
+        """Buffer a swarm event; a flush is scheduled if none is pending."""
+        self._event_queue.append((event_type, data))
+        if self._event_flush_task is None or self._event_flush_task.done():
+            self._event_flush_task = asyncio.create_task(self._flush_events())
+    
+    async def _flush_events(self):
+        """
+        Emit buffered events after a short coalescing window.
+        
+        Sends one event per type whose payload is {"events": [...]}, so a
+        burst of honeypot hits costs one bus message per type. Repeated
+        blacklist requests for the same address collapse to the latest.
+        Keeps flushing until the queue is empty: events queued while this
+        task awaits emit_event get no flush task of their own.
+        """
+        while self._event_queue:
+            await asyncio.sleep(self.config["event_flush_seconds"])
+            queue, self._event_queue = self._event_queue, []
+            
+            batches: Dict[str, List[Dict]] = {}
+            blacklist: Dict[str, Dict] = {}
+            for event_type, data in queue:
+                if event_type == "blacklist_address":
+                    blacklist[data["address"]] = data
+                else:
+                    batches.setdefault(event_type, []).append(data)
+            if blacklist:
+                batches["blacklist_address"] = list(blacklist.values())
+            
+            # One failed type must not cost the others their delivery
+            for event_type, events in batches.items():
+                try:
+                    await self.emit_event(event_type, {"events": events})
+                except Exception as e:
+                    self.log.warning(
+                        "Swarm event emit failed",
+                        event_type=event_type,
+                        events=len(events),
+                        error=str(e),
+                    )
+    
     def _classify_attack(self, interaction: Dict) -> AttackType:
         """Classify the type of attack based on interaction pattern."""
         # Would analyze transaction data to classify
         # Placeholder logic
-        if interaction.get("involves_approval"):
-            return AttackType.APPROVAL_EXPLOIT
-        elif interaction.get("drains_all"):
-            return AttackType.DRAINER
-        elif interaction.get("sweeps_tokens"):
-            return AttackType.SWEEPER
+        for flag, attack_type in _ATTACK_RULES:
+            if interaction.get(flag):
+                return attack_type
         return AttackType.UNKNOWN
     
     def _extract_tool_signature(self, interaction: Dict) -> Optional[str]:
         """Extract unique signature of attacker's tool/script."""
         # Would hash program invocations, patterns, etc.
+        # 8-byte BLAKE2b gives the same 16 hex chars as truncated SHA-256
+        # without computing and discarding the rest of a 32-byte digest
         if "program_id" in interaction:
-            return hashlib.sha256(
-                interaction["program_id"].encode()
-            ).hexdigest()[:16]
+            return hashlib.blake2b(
+                interaction["program_id"].encode(), digest_size=8
+            ).hexdigest()
         return None
     
-    async def _blacklist_attacker(self, address: str, profile: AttackerProfile):
+    def _blacklist_attacker(self, address: str, profile: AttackerProfile):
         """Add attacker to global blacklist."""
         # Emit blacklist event for Intel agent
-        await self.emit_event("blacklist_address", {
+        self._queue_event("blacklist_address", {
             "address": address,
             "reason": "honeypot_triggered",
             "risk_score": profile.risk_score,
-            "attack_types": [t.value for t in profile.attack_types]
+            "attack_types": [_ATTACK_VALUES[t] for t in profile.attack_types]
         })
     
     async def get_deployments(self, active_only: bool = True) -> List[Dict]:
         """Get all honeypot deployments."""
-        deployments = []
-        for d in self.deployments.values():
-            if active_only and not d.is_active:
-                continue
-            deployments.append({
-                "id": d.id,
-                "address": d.address,
-                "type": d.honeypot_type.value,
-                "bait_amount": d.bait_amount_sol,
-                "deployed_at": d.deployed_at.isoformat(),
-                "is_active": d.is_active,
-                "interactions_count": len(d.interactions),
-                "attackers_caught": len(d.attackers_caught)
-            })
-        return deployments
+        return self._get_deployments_sync(active_only)
     
     async def get_attacker_profile(self, address: str) -> Optional[Dict]:
         """Get detailed profile of a caught attacker."""
-        if address not in self.attackers:
-            return None
-        
-        profile = self.attackers[address]
-        return {
-            "address": profile.address,
-            "first_seen": profile.first_seen.isoformat(),
-            "last_seen": profile.last_seen.isoformat(),
-            "attack_types": [t.value for t in profile.attack_types],
-            "tool_signatures": profile.tool_signatures,
-            "total_interactions": profile.total_interactions,
-            "honeypots_triggered": profile.honeypots_triggered,
-            "risk_score": profile.risk_score
-        }
+        return self._get_attacker_profile_sync(address)
     
     async def deactivate_honeypot(self, honeypot_id: str) -> bool:
         """Deactivate a honeypot deployment."""
+        return self._deactivate_honeypot_sync(honeypot_id)
+    
+    # In-memory lookups; process_task calls these directly so no
+    # coroutine is created for work that never awaits
+    
+    def _get_deployments_sync(self, active_only: bool = True) -> List[Dict]:
+        ids = self._active_ids if active_only else self.deployments
+        return [self.deployments[honeypot_id].to_dict() for honeypot_id in ids]
+    
+    def _get_attacker_profile_sync(self, address: str) -> Optional[Dict]:
+        profile = self.attackers.get(address)
+        return profile.to_dict() if profile else None
+    
+    def _deactivate_honeypot_sync(self, honeypot_id: str) -> bool:
         if honeypot_id in self.deployments:
             self.deployments[honeypot_id].is_active = False
+            self._active_ids.pop(honeypot_id, None)
             self.log_info(f"Honeypot {honeypot_id} deactivated")
             return True
         return False
@@ -357,7 +480,7 @@ class HoneypotAgent(BaseAgent):
                 "deployment": {
                     "id": deployment.id,
                     "address": deployment.address,
-                    "type": deployment.honeypot_type.value,
+                    "type": _HONEYPOT_TYPE_VALUES[deployment.honeypot_type],
                     "bait_amount": deployment.bait_amount_sol
                 }
             }
@@ -365,23 +488,23 @@ class HoneypotAgent(BaseAgent):
         elif task_type == "get_deployments":
             return {
                 "success": True,
-                "deployments": await self.get_deployments(
+                "deployments": self._get_deployments_sync(
                     active_only=task.get("active_only", True)
                 )
             }
         
         elif task_type == "get_attacker":
-            profile = await self.get_attacker_profile(task["address"])
+            profile = self._get_attacker_profile_sync(task["address"])
             return {
                 "success": profile is not None,
                 "profile": profile
             }
         
         elif task_type == "deactivate":
-            success = await self.deactivate_honeypot(task["honeypot_id"])
+            success = self._deactivate_honeypot_sync(task["honeypot_id"])
             return {"success": success}
         
         elif task_type == "get_statistics":
-            return {"success": True, "statistics": self.stats}
+            return {"success": True, "statistics": self.stats.to_dict()}
         
         return {"success": False, "error": f"Unknown task type: {task_type}"}
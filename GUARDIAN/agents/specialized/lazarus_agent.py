@@ -8,12 +8,14 @@ Inspired by REKT Shield's counter-intelligence capabilities.
 """
 
 import asyncio
-import hashlib
+from collections import deque
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, FrozenSet, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 from agents.core.base_agent import BaseAgent
 
 
@@ -27,12 +29,98 @@ class LazarusPattern(Enum):
     FAST_CONSOLIDATION = "fast_consolidation" # Rapid fund consolidation
 
 
-@dataclass
+# Pattern -> serialized value, resolved once instead of per Enum.value access
+_PATTERN_VALUES = {p: p.value for p in LazarusPattern}
+
+# Alerts kept in memory; older ones are dropped
+MAX_ALERTS = 10_000
+
+# DPRK business hours (9 AM - 6 PM UTC+9) expressed in UTC
+UTC9_WINDOW_UTC_HOURS = (0, 9)
+UTC9_ACTIVITY_THRESHOLD = 0.6  # Fraction of txs inside the window to flag
+UTC9_MIN_TRANSACTIONS = 10  # Too few txs says nothing about working hours
+
+
+def _utc9_activity(block_times: List[int]) -> Optional[Dict]:
+    """
+    Score how much of an address's activity falls in DPRK working hours.
+    
+    Vectorized over the unix block times, so addresses with 10k+
+    transactions cost one array pass instead of a Python loop.
+    """
+    if len(block_times) < UTC9_MIN_TRANSACTIONS:
+        return None
+    
+    ts = np.asarray(block_times, dtype=np.int64)
+    hours_utc = (ts // 3600) % 24
+    start, end = UTC9_WINDOW_UTC_HOURS
+    fraction = float(((hours_utc >= start) & (hours_utc < end)).mean())
+    if fraction <= UTC9_ACTIVITY_THRESHOLD:
+        return None
+    return {"fraction": fraction, "tx_count": int(ts.size)}
+
+
+def _peel_windows(amounts, timestamps, window_s, min_count):
+    """
+    Find the most uniform run of outgoing amounts within window_s.
+    
+    Two-pointer scan over time-sorted transfers with running sums, so
+    each window's coefficient of variation is O(1) to update. Returns
+    (cv, start, end) for the lowest-CV window holding at least
+    min_count transfers, or (inf, 0, 0) if there is none.
+    """
+    best_cv = np.inf
+    best_start = 0
+    best_end = 0
+    total = 0.0
+    total_sq = 0.0
+    left = 0
+    for right in range(amounts.shape[0]):
+        total += amounts[right]
+        total_sq += amounts[right] * amounts[right]
+        while timestamps[right] - timestamps[left] > window_s:
+            total -= amounts[left]
+            total_sq -= amounts[left] * amounts[left]
+            left += 1
+        count = right - left + 1
+        if count >= min_count:
+            mean = total / count
+            if mean > 0:
+                variance = max(total_sq / count - mean * mean, 0.0)
+                cv = np.sqrt(variance) / mean
+                if cv < best_cv:
+                    best_cv = cv
+                    best_start = left
+                    best_end = right + 1
+    return best_cv, best_start, best_end
+
+
+_peel_kernel = None
+
+
+def _peel_score(amounts, timestamps, window_s: int, min_count: int):
+    """Run _peel_windows, JIT-compiled with numba when it is installed."""
+    global _peel_kernel
+    if _peel_kernel is None:
+        try:
+            from numba import njit
+            _peel_kernel = njit(cache=True)(_peel_windows)
+        except ImportError:
+            _peel_kernel = _peel_windows
+    return _peel_kernel(amounts, timestamps, window_s, min_count)
+
+
+def _warm_peel_score():
+    """Compile and cache the peel-chain kernel (see GUARDIAN.warmup)."""
+    _peel_score(np.ones(4), np.arange(4, dtype=np.int64), 14_400, 2)
+
+
+@dataclass(slots=True)
 class LazarusAlert:
     """Alert for potential Lazarus Group activity"""
     address: str
     confidence: float  # 0-100
-    patterns_matched: List[LazarusPattern]
+    patterns_matched: Tuple[LazarusPattern, ...]
     indicators: Dict[str, Any]
     timestamp: datetime
     fund_flow: Optional[Dict] = None
@@ -65,14 +153,15 @@ class LazarusAgent(BaseAgent):
             config=config
         )
         
-        # Known OFAC sanctioned addresses (sample - would be updated from real sources)
-        self.ofac_addresses = set([
+        # Known OFAC sanctioned addresses (sample - would be updated from real sources).
+        # Frozen after load; refreshes swap in a whole new frozenset.
+        self.ofac_addresses: FrozenSet[str] = frozenset([
             # These would be loaded from official OFAC SDN list
             # Placeholder examples
         ])
         
         # Known mixer/tumbler programs on Solana
-        self.known_mixers = set([
+        self.known_mixers: FrozenSet[str] = frozenset([
             # Add known mixer program IDs
         ])
         
@@ -85,6 +174,7 @@ class LazarusAgent(BaseAgent):
             },
             LazarusPattern.PEEL_CHAIN: {
                 "transaction_count": 50,
+                "unique_recipients": 25,
                 "amount_variance": 0.1,  # Similar amounts
                 "time_window_hours": 4
             },
@@ -94,8 +184,9 @@ class LazarusAgent(BaseAgent):
             }
         }
         
-        # Alert history
-        self.alerts: List[LazarusAlert] = []
+        # Alert history (bounded, with a running confidence total for stats)
+        self.alerts: Deque[LazarusAlert] = deque(maxlen=MAX_ALERTS)
+        self._confidence_sum = 0.0
         self.tracked_addresses: Dict[str, Dict] = {}
         
         # Statistics
@@ -106,6 +197,17 @@ class LazarusAgent(BaseAgent):
             "patterns_detected": {}
         }
     
+    def load_watchlists(
+        self,
+        ofac_addresses: Optional[List[str]] = None,
+        known_mixers: Optional[List[str]] = None
+    ):
+        """Replace the OFAC and/or mixer lists with freshly loaded entries."""
+        if ofac_addresses is not None:
+            self.ofac_addresses = frozenset(ofac_addresses)
+        if known_mixers is not None:
+            self.known_mixers = frozenset(known_mixers)
+    
     async def analyze_address(self, address: str) -> LazarusAlert:
         """
         Analyze an address for Lazarus Group patterns.
@@ -119,41 +221,52 @@ class LazarusAgent(BaseAgent):
         confidence = 0.0
         
         # Check 1: OFAC flagged
-        if address in self.ofac_addresses:
+        ofac_flagged = address in self.ofac_addresses
+        if ofac_flagged:
             indicators["ofac_flagged"] = True
             confidence += 40
             self.log_info(f"⚠️ OFAC flagged address detected: {address[:8]}...")
         
+        # Checks 2-6 each query transaction history; run them concurrently
+        (
+            utc9_activity,
+            mixer_usage,
+            peel_chain,
+            bridge_pattern,
+            consolidation,
+        ) = await asyncio.gather(
+            self._check_utc9_pattern(address),
+            self._check_mixer_usage(address),
+            self._detect_peel_chain(address),
+            self._check_bridge_exploit_pattern(address),
+            self._check_fast_consolidation(address),
+        )
+        
         # Check 2: UTC+9 activity pattern
-        utc9_activity = await self._check_utc9_pattern(address)
         if utc9_activity:
             indicators["utc9_activity"] = utc9_activity
             patterns_matched.append(LazarusPattern.CHAIN_HOPPING)
             confidence += 15
         
         # Check 3: Mixer interaction
-        mixer_usage = await self._check_mixer_usage(address)
         if mixer_usage:
             indicators["mixer_usage"] = mixer_usage
             patterns_matched.append(LazarusPattern.MIXER_USAGE)
             confidence += 20
         
         # Check 4: Peel chain detection
-        peel_chain = await self._detect_peel_chain(address)
         if peel_chain:
             indicators["peel_chain"] = peel_chain
             patterns_matched.append(LazarusPattern.PEEL_CHAIN)
             confidence += 15
         
         # Check 5: Bridge exploit pattern
-        bridge_pattern = await self._check_bridge_exploit_pattern(address)
         if bridge_pattern:
             indicators["bridge_exploit"] = bridge_pattern
             patterns_matched.append(LazarusPattern.BRIDGE_EXPLOIT)
             confidence += 25
         
         # Check 6: Fast consolidation
-        consolidation = await self._check_fast_consolidation(address)
         if consolidation:
             indicators["fast_consolidation"] = consolidation
             patterns_matched.append(LazarusPattern.FAST_CONSOLIDATION)
@@ -166,10 +279,10 @@ class LazarusAgent(BaseAgent):
         alert = LazarusAlert(
             address=address,
             confidence=confidence,
-            patterns_matched=patterns_matched,
+            patterns_matched=tuple(patterns_matched),
             indicators=indicators,
             timestamp=datetime.now(timezone.utc),
-            ofac_flagged=address in self.ofac_addresses,
+            ofac_flagged=ofac_flagged,
             utc9_activity=utc9_activity is not None
         )
         
@@ -178,7 +291,10 @@ class LazarusAgent(BaseAgent):
             self.stats["high_confidence_alerts"] += 1
             await self._escalate_alert(alert)
         
+        if len(self.alerts) == self.alerts.maxlen:
+            self._confidence_sum -= self.alerts[0].confidence
         self.alerts.append(alert)
+        self._confidence_sum += confidence
         self.stats["alerts_generated"] += 1
         
         return alert
@@ -190,12 +306,15 @@ class LazarusAgent(BaseAgent):
         
         Lazarus Group often operates during DPRK business hours.
         """
-        # Would fetch transaction history and analyze timestamps
         # Looking for activity patterns between 9 AM - 6 PM UTC+9
         # Which is 0:00 - 9:00 UTC
-        
-        # Placeholder - would integrate with Helius/RPC
-        return None
+        block_times = await self._get_block_times(address)
+        return _utc9_activity(block_times)
+    
+    async def _get_block_times(self, address: str) -> List[int]:
+        """Unix block times of an address's recent transactions."""
+        # Placeholder - would integrate with Helius/RPC (getSignaturesForAddress blockTime)
+        return []
     
     async def _check_mixer_usage(self, address: str) -> Optional[Dict]:
         """
@@ -211,11 +330,39 @@ class LazarusAgent(BaseAgent):
         Peel chains involve sending similar small amounts to many
         addresses in rapid succession to obscure fund flow.
         """
-        # Would analyze outgoing transactions for:
+        # Looks at outgoing transactions for:
         # - Similar amounts (low variance)
         # - High frequency
         # - Many unique recipients
-        return None
+        transfers = await self._get_outgoing_transfers(address)
+        signature = self.attack_signatures[LazarusPattern.PEEL_CHAIN]
+        min_count = signature["transaction_count"]
+        if len(transfers) < min_count:
+            return None
+        
+        transfers.sort(key=lambda t: t[0])
+        timestamps = np.fromiter((t[0] for t in transfers), dtype=np.int64, count=len(transfers))
+        amounts = np.fromiter((t[1] for t in transfers), dtype=np.float64, count=len(transfers))
+        window_s = signature["time_window_hours"] * 3600
+        
+        cv, start, end = _peel_score(amounts, timestamps, window_s, min_count)
+        if cv > signature["amount_variance"]:
+            return None
+        
+        recipients = {t[2] for t in transfers[start:end]}
+        if len(recipients) < signature["unique_recipients"]:
+            return None
+        return {
+            "transactions": end - start,
+            "amount_cv": float(cv),
+            "unique_recipients": len(recipients),
+            "window_hours": signature["time_window_hours"],
+        }
+    
+    async def _get_outgoing_transfers(self, address: str) -> List[Tuple[int, float, str]]:
+        """(block time, amount, recipient) for an address's outgoing transfers."""
+        # Placeholder - would integrate with Helius/RPC
+        return []
     
     async def _check_bridge_exploit_pattern(self, address: str) -> Optional[Dict]:
         """
@@ -252,28 +399,37 @@ class LazarusAgent(BaseAgent):
             f"🚨 HIGH CONFIDENCE LAZARUS ALERT\n"
             f"   Address: {alert.address}\n"
             f"   Confidence: {alert.confidence}%\n"
-            f"   Patterns: {[p.value for p in alert.patterns_matched]}"
+            f"   Patterns: {[_PATTERN_VALUES[p] for p in alert.patterns_matched]}"
         )
         
         # Emit event for swarm coordination
         await self.emit_event("lazarus_alert", {
             "address": alert.address,
             "confidence": alert.confidence,
-            "patterns": [p.value for p in alert.patterns_matched],
+            "patterns": [_PATTERN_VALUES[p] for p in alert.patterns_matched],
             "timestamp": alert.timestamp.isoformat()
         })
     
     async def get_alerts(self, min_confidence: float = 0) -> List[LazarusAlert]:
         """Get all alerts above confidence threshold."""
-        return [a for a in self.alerts if a.confidence >= min_confidence]
+        return self._get_alerts_sync(min_confidence)
     
     async def get_statistics(self) -> Dict:
         """Get agent statistics."""
+        return self._get_statistics_sync()
+    
+    # In-memory lookups; process_task calls these directly so no
+    # coroutine is created for work that never awaits
+    
+    def _get_alerts_sync(self, min_confidence: float = 0) -> List[LazarusAlert]:
+        return [a for a in self.alerts if a.confidence >= min_confidence]
+    
+    def _get_statistics_sync(self) -> Dict:
         return {
             **self.stats,
             "total_alerts": len(self.alerts),
             "average_confidence": (
-                sum(a.confidence for a in self.alerts) / len(self.alerts)
+                self._confidence_sum / len(self.alerts)
                 if self.alerts else 0
             )
         }
@@ -289,21 +445,21 @@ class LazarusAgent(BaseAgent):
                 "alert": {
                     "address": alert.address,
                     "confidence": alert.confidence,
-                    "patterns": [p.value for p in alert.patterns_matched],
+                    "patterns": [_PATTERN_VALUES[p] for p in alert.patterns_matched],
                     "ofac_flagged": alert.ofac_flagged,
                     "utc9_activity": alert.utc9_activity
                 }
             }
         
         elif task_type == "get_alerts":
-            alerts = await self.get_alerts(task.get("min_confidence", 0))
+            alerts = self._get_alerts_sync(task.get("min_confidence", 0))
             return {
                 "success": True,
                 "alerts": [
                     {
                         "address": a.address,
                         "confidence": a.confidence,
-                        "patterns": [p.value for p in a.patterns_matched]
+                        "patterns": [_PATTERN_VALUES[p] for p in a.patterns_matched]
                     }
                     for a in alerts
                 ]
@@ -312,7 +468,7 @@ class LazarusAgent(BaseAgent):
         elif task_type == "get_statistics":
             return {
                 "success": True,
-                "statistics": await self.get_statistics()
+                "statistics": self._get_statistics_sync()
             }
         
         return {"success": False, "error": f"Unknown task type: {task_type}"}
@@ -8,16 +8,26 @@ The nervous system of the swarm - knows when the network is under stress.
 """
 
 import asyncio
+import os
+import time
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Deque, Dict, Iterator, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from agents.core.base_agent import BaseAgent
 
+from ._wire import dumps
+
 
 class CongestionLevel(Enum):
-    """Network congestion levels (1-5)"""
+    """Network congestion levels (1-5; 0 when metrics are unavailable)"""
+    UNKNOWN = 0        # No metrics yet (RPC unavailable)
     CLEAR = 1          # Normal operations
     LIGHT = 2          # Slightly elevated
     MODERATE = 3       # Noticeable delays
@@ -38,7 +48,60 @@ class NetworkEvent(Enum):
     EPOCH_CHANGE = "epoch_change"
 
 
-@dataclass
+# Serialized event types emitted by _detect_events, resolved once instead of
+# per Enum.value access
+_EV_DDOS_SUSPECTED = NetworkEvent.DDOS_SUSPECTED.value
+_EV_TPS_DROP = NetworkEvent.TPS_DROP.value
+_EV_TPS_SPIKE = NetworkEvent.TPS_SPIKE.value
+_EV_BLOCK_TIME_HIGH = NetworkEvent.BLOCK_TIME_HIGH.value
+_EV_VALIDATOR_CONCENTRATION = NetworkEvent.VALIDATOR_CONCENTRATION.value
+
+# Congestion level -> report name, and -> health score penalty (10 per level)
+_CONGESTION_NAMES = {c: c.name for c in CongestionLevel}
+_CONGESTION_HEALTH_PENALTY = {c: max(0, c.value - 1) * 10 for c in CongestionLevel}
+
+# Congestion level by (TPS bucket, block-time bucket). TPS buckets are
+# [below drop-critical, normal, above DDoS indicator]; block-time buckets are
+# [<= high, <= critical, > critical]. Abnormal TPS in either direction adds
+# two levels, block time adds one or two.
+_CONGESTION_TABLE = (
+    (CongestionLevel.MODERATE, CongestionLevel.HEAVY, CongestionLevel.CRITICAL),
+    (CongestionLevel.CLEAR, CongestionLevel.LIGHT, CongestionLevel.MODERATE),
+    (CongestionLevel.MODERATE, CongestionLevel.HEAVY, CongestionLevel.CRITICAL),
+)
+
+# Health score penalties by TPS bucket [below normal, normal, above DDoS]
+# and by the block-time buckets above
+_TPS_HEALTH_PENALTY = (20, 0, 30)
+_BLOCK_TIME_HEALTH_PENALTY = (0, 15, 40)
+
+
+def _tps_bucket(tps: float, edges: Tuple[float, float]) -> int:
+    """0 below edges[0], 2 above edges[1], 1 in between (both bounds inclusive)."""
+    return (tps >= edges[0]) + (tps > edges[1])
+
+
+# In-memory retention; older entries are dropped
+STATUS_HISTORY_MAX = 1000
+MAX_EVENTS = 10_000
+MAX_MEV_ALERTS = 1000
+
+# Per-metric ring buffers (struct-of-arrays) backing the rolling anomaly test
+METRIC_RING_SIZE = 1024
+ANOMALY_WINDOW = 16  # Samples averaged before comparing against the baseline
+
+# Simulated readings (used when no rpc_url is configured) are drawn in batches
+_RNG = np.random.default_rng()
+SIMULATED_BATCH = 4096
+
+
+def _uniform_stream(low: float, high: float) -> Iterator[float]:
+    """Endless uniform samples, refilled SIMULATED_BATCH at a time."""
+    while True:
+        yield from _RNG.uniform(low, high, SIMULATED_BATCH).tolist()
+
+
+@dataclass(slots=True, frozen=True)
 class NetworkStatus:
     """Current network status snapshot"""
     timestamp: datetime
@@ -53,7 +116,7 @@ class NetworkStatus:
     health_score: int  # 0-100
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MEVAlert:
     """MEV/Sandwich attack detection"""
     timestamp: datetime
@@ -62,6 +125,16 @@ class MEVAlert:
     attacker_address: str
     profit_estimate_sol: float
     affected_token: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "attack_type": self.attack_type,
+            "victim_signature": self.victim_signature,
+            "attacker_address": self.attacker_address,
+            "profit_estimate_sol": self.profit_estimate_sol,
+            "affected_token": self.affected_token
+        }
 
 
 class NetworkAgent(BaseAgent):
@@ -95,6 +168,15 @@ class NetworkAgent(BaseAgent):
             config=config
         )
         
+        self.config = config or {}
+        
+        # Solana RPC. Without an endpoint the metric getters return simulated
+        # values; providers that penalize JSON-RPC batches can set
+        # rpc_batch=False to fan the same calls out concurrently instead.
+        self.rpc_url = self.config.get("rpc_url", os.getenv("SOLANA_RPC_URL"))
+        self.rpc_batch = self.config.get("rpc_batch", True)
+        self._rpc_client = None  # Created on first RPC call
+        
         # Thresholds
         self.thresholds = {
             "tps_normal_low": 2000,
@@ -104,15 +186,31 @@ class NetworkAgent(BaseAgent):
             "block_time_normal_ms": 500,
             "block_time_high_ms": 800,
             "block_time_critical_ms": 1200,
+            "tps_spike_zscore": 4.0,  # Smoothed TPS vs. recent baseline
             "validator_concentration_warning": 33,  # Top validator % stake
             "sandwich_profit_threshold_sol": 0.01
         }
         
+        self._build_decision_tables()
+        
         # State
         self.current_status: Optional[NetworkStatus] = None
-        self.status_history: List[NetworkStatus] = []
-        self.mev_alerts: List[MEVAlert] = []
-        self.events: List[Dict] = []
+        self._report_cache: Optional[Tuple[NetworkStatus, Dict]] = None  # (status, report)
+        self.status_history: Deque[NetworkStatus] = deque(maxlen=STATUS_HISTORY_MAX)
+        self.mev_alerts: Deque[MEVAlert] = deque(maxlen=MAX_MEV_ALERTS)
+        self.events: Deque[Dict] = deque(maxlen=MAX_EVENTS)
+        
+        # Metric history as parallel arrays; _ring_idx counts samples ever written
+        self._ring = {
+            "tps": np.zeros(METRIC_RING_SIZE, dtype=np.float32),
+            "block_time": np.zeros(METRIC_RING_SIZE, dtype=np.float32),
+            "ts": np.zeros(METRIC_RING_SIZE, dtype=np.int64),
+        }
+        self._ring_idx = 0
+        
+        # Simulated metric sources for the placeholder getters
+        self._simulated_tps = _uniform_stream(2500, 3500)
+        self._simulated_block_time = _uniform_stream(400, 600)
         
         # Monitoring state
         self.last_tps_values: List[float] = []
@@ -124,7 +222,17 @@ class NetworkAgent(BaseAgent):
             "ddos_alerts": 0,
             "mev_detected": 0,
             "sandwich_attacks": 0,
-            "high_congestion_periods": 0
+            "high_congestion_periods": 0,
+            "rpc_failures": 0
+        }
+        
+        # Task type -> handler, used by process_task
+        self._task_handlers = {
+            "check_status": self._task_check_status,
+            "health_report": self._task_health_report,
+            "detect_mev": self._task_detect_mev,
+            "get_events": self._task_get_events,
+            "get_statistics": self._task_get_statistics,
         }
     
     async def check_network_status(self) -> NetworkStatus:
@@ -138,24 +246,33 @@ class NetworkAgent(BaseAgent):
         """
         self.stats["status_checks"] += 1
         
-        # Simulated data (would be real RPC calls in production)
-        tps = await self._get_current_tps()
-        block_time = await self._get_block_time()
-        slot_height = await self._get_slot_height()
-        epoch = await self._get_epoch()
-        validator_info = await self._get_validator_info()
+        try:
+            tps, block_time, slot_height, epoch, validator_info = await self._fetch_metrics()
+        except Exception as e:
+            # An RPC outage degrades the answer instead of failing the check:
+            # keep the last good status, or report an unknown one
+            self.stats["rpc_failures"] += 1
+            self.log_warning(f"Network metrics unavailable: {e}")
+            if self.current_status is None:
+                self.current_status = self._unknown_status()
+            return self.current_status
+        
+        # One clock read per check, shared by the ring buffer, events and status
+        now_ns = time.time_ns()
+        now = datetime.fromtimestamp(now_ns / 1e9, timezone.utc)
+        self._record_sample(tps, block_time, now_ns)
         
         # Calculate congestion level
         congestion = self._calculate_congestion(tps, block_time)
         
         # Check for events
-        events = await self._detect_events(tps, block_time, validator_info)
+        events = await self._detect_events(tps, block_time, validator_info, now)
         
         # Calculate health score
         health_score = self._calculate_health_score(tps, block_time, congestion)
         
         status = NetworkStatus(
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             tps=tps,
             block_time_ms=block_time,
             slot_height=slot_height,
@@ -163,17 +280,13 @@ class NetworkAgent(BaseAgent):
             congestion_level=congestion,
             active_validators=validator_info.get("count", 0),
             top_validator_stake_pct=validator_info.get("top_stake_pct", 0),
-            recent_events=[e for e in events],
+            recent_events=events,
             health_score=health_score
         )
         
         self.current_status = status
         self.status_history.append(status)
         
-        # Keep last 1000 status checks
-        if len(self.status_history) > 1000:
-            self.status_history = self.status_history[-1000:]
-        
         # Alert on critical events
         for event in events:
             if event.get("severity") == "critical":
@@ -181,18 +294,154 @@ class NetworkAgent(BaseAgent):
         
         return status
     
+    async def _fetch_metrics(self) -> Tuple[float, float, int, int, Dict]:
+        """
+        Fetch (tps, block_time_ms, slot, epoch, validator_info) in one round-trip.
+        
+        All four RPC methods go out as a single JSON-RPC batch; TPS and
+        block time are derived locally from the latest performance sample.
+        """
+        if not self.rpc_url:
+            return await asyncio.gather(
+                self._get_current_tps(),
+                self._get_block_time(),
+                self._get_slot_height(),
+                self._get_epoch(),
+                self._get_validator_info(),
+            )
+        
+        calls = [
+            ("getRecentPerformanceSamples", [1]),
+            ("getSlot", []),
+            ("getEpochInfo", []),
+            ("getVoteAccounts", []),
+        ]
+        if self.rpc_batch:
+            results = await self._batch_rpc(calls)
+        else:
+            replies = await asyncio.gather(*(self._batch_rpc([call]) for call in calls))
+            results = [result for (result,) in replies]
+        samples, slot_height, epoch_info, vote_accounts = results
+        if not samples:
+            raise RuntimeError("getRecentPerformanceSamples returned no samples")
+        
+        sample = samples[0]
+        period_s = sample["samplePeriodSecs"] or 1
+        tps = sample["numTransactions"] / period_s
+        block_time = period_s * 1000 / max(sample["numSlots"], 1)
+        
+        stakes = sorted(
+            (v["activatedStake"] for v in vote_accounts["current"]), reverse=True
+        )
+        total_stake = sum(stakes) or 1
+        validator_info = {
+            "count": len(stakes),
+            "top_stake_pct": (stakes[0] if stakes else 0) * 100 / total_stake,
+            "top_10_stake_pct": sum(stakes[:10]) * 100 / total_stake,
+        }
+        
+        return tps, block_time, slot_height, epoch_info["epoch"], validator_info
+    
+    def _unknown_status(self) -> NetworkStatus:
+        """Status for when no metrics have been fetched yet"""
+        return NetworkStatus(
+            timestamp=datetime.now(timezone.utc),
+            tps=0.0,
+            block_time_ms=0.0,
+            slot_height=0,
+            epoch=0,
+            congestion_level=CongestionLevel.UNKNOWN,
+            active_validators=0,
+            top_validator_stake_pct=0.0,
+            recent_events=[],
+            health_score=0
+        )
+    
+    def _get_rpc_client(self):
+        """Get the shared RPC HTTP client, creating it on first use"""
+        if self._rpc_client is None:
+            import httpx
+            self._rpc_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=75.0),
+            )
+        return self._rpc_client
+    
+    async def close(self):
+        """Close the RPC HTTP client"""
+        if self._rpc_client is not None:
+            await self._rpc_client.aclose()
+            self._rpc_client = None
+    
+    async def _batch_rpc(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Send JSON-RPC calls as one array (batch) request.
+        
+        Results are returned in the same order as `calls`. Raises on any
+        RPC error, including a rejected batch.
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = await self._get_rpc_client().post(self.rpc_url, json=payload)
+        response.raise_for_status()
+        
+        # Providers that reject batches answer with one error object
+        replies = response.json()
+        if not isinstance(replies, list):
+            raise RuntimeError(f"RPC batch rejected: {replies}")
+        
+        # Batch replies may arrive in any order
+        results = []
+        for reply in sorted(replies, key=lambda r: r["id"]):
+            if "error" in reply:
+                raise RuntimeError(f"RPC {calls[reply['id']][0]} failed: {reply['error']}")
+            results.append(reply["result"])
+        return results
+    
+    def _record_sample(self, tps: float, block_time: float, ts_ns: int):
+        """Write one metric sample into the ring buffers."""
+        i = self._ring_idx % METRIC_RING_SIZE
+        self._ring["tps"][i] = tps
+        self._ring["block_time"][i] = block_time
+        self._ring["ts"][i] = ts_ns
+        self._ring_idx += 1
+    
+    def _recent(self, field: str, count: int) -> np.ndarray:
+        """Up to `count` most recent samples of a metric, oldest first."""
+        count = min(count, self._ring_idx, METRIC_RING_SIZE)
+        return np.take(
+            self._ring[field], np.arange(self._ring_idx - count, self._ring_idx), mode="wrap"
+        )
+    
+    def _smoothed_anomaly(self, field: str, d: int = ANOMALY_WINDOW) -> float:
+        """
+        Z-score of the mean of the last `d` samples against the history before them.
+        
+        Averaging over a window suppresses single noisy samples; the mean of
+        d draws has standard error sigma/sqrt(d). Returns 0.0 until at least
+        2*d samples have been recorded.
+        """
+        samples = self._recent(field, METRIC_RING_SIZE)
+        if len(samples) < 2 * d:
+            return 0.0
+        baseline = samples[:-d]
+        sigma = baseline.std()
+        if sigma == 0:
+            return 0.0
+        return float((samples[-d:].mean() - baseline.mean()) / (sigma / np.sqrt(d)))
+    
     async def _get_current_tps(self) -> float:
         """Get current TPS from RPC."""
         # Would call getRecentPerformanceSamples in production
         # Placeholder returning simulated value
-        import random
-        return random.uniform(2500, 3500)
+        return next(self._simulated_tps)
     
     async def _get_block_time(self) -> float:
         """Get current average block time."""
         # Would calculate from recent slots
-        import random
-        return random.uniform(400, 600)
+        return next(self._simulated_block_time)
     
     async def _get_slot_height(self) -> int:
         """Get current slot height."""
@@ -213,83 +462,88 @@ class NetworkAgent(BaseAgent):
             "top_10_stake_pct": 35.0
         }
     
+    def _build_decision_tables(self):
+        """
+        Precompute bucket edges from self.thresholds.
+        
+        Call again after changing any TPS or block-time threshold.
+        """
+        t = self.thresholds
+        self._congestion_tps_edges = (t["tps_drop_critical"], t["tps_ddos_indicator"])
+        self._health_tps_edges = (t["tps_normal_low"], t["tps_ddos_indicator"])
+        self._block_time_edges = (t["block_time_high_ms"], t["block_time_critical_ms"])
+    
     def _calculate_congestion(self, tps: float, block_time: float) -> CongestionLevel:
         """Calculate network congestion level (1-5)."""
-        score = 0
-        
-        # TPS factor
-        if tps < self.thresholds["tps_drop_critical"]:
-            score += 2
-        elif tps > self.thresholds["tps_ddos_indicator"]:
-            score += 2  # DDoS also causes congestion
-        
-        # Block time factor
-        if block_time > self.thresholds["block_time_critical_ms"]:
-            score += 2
-        elif block_time > self.thresholds["block_time_high_ms"]:
-            score += 1
-        
-        # Map score to congestion level
-        if score >= 4:
-            return CongestionLevel.CRITICAL
-        elif score >= 3:
-            return CongestionLevel.HEAVY
-        elif score >= 2:
-            return CongestionLevel.MODERATE
-        elif score >= 1:
-            return CongestionLevel.LIGHT
-        return CongestionLevel.CLEAR
+        return _CONGESTION_TABLE[_tps_bucket(tps, self._congestion_tps_edges)][
+            bisect_left(self._block_time_edges, block_time)
+        ]
     
     async def _detect_events(
         self, 
         tps: float, 
         block_time: float,
-        validator_info: Dict
+        validator_info: Dict,
+        now: datetime
     ) -> List[Dict]:
         """Detect network events based on metrics."""
+        thresholds = self.thresholds
+        top_stake_pct = validator_info.get("top_stake_pct", 0)
+        timestamp = now.isoformat()
         events = []
         
         # TPS anomalies
-        if tps > self.thresholds["tps_ddos_indicator"]:
+        if tps > thresholds["tps_ddos_indicator"]:
             events.append({
-                "type": NetworkEvent.DDOS_SUSPECTED.value,
+                "type": _EV_DDOS_SUSPECTED,
                 "severity": "critical",
                 "message": f"Possible DDoS: TPS at {tps:.0f}",
-                "value": tps
+                "value": tps,
+                "timestamp": timestamp
             })
             self.stats["ddos_alerts"] += 1
         
-        elif tps < self.thresholds["tps_drop_critical"]:
+        elif tps < thresholds["tps_drop_critical"]:
             events.append({
-                "type": NetworkEvent.TPS_DROP.value,
+                "type": _EV_TPS_DROP,
                 "severity": "warning",
                 "message": f"TPS dropped to {tps:.0f}",
-                "value": tps
+                "value": tps,
+                "timestamp": timestamp
+            })
+        
+        elif self._smoothed_anomaly("tps") >= thresholds["tps_spike_zscore"]:
+            events.append({
+                "type": _EV_TPS_SPIKE,
+                "severity": "warning",
+                "message": f"TPS rising above recent baseline: {tps:.0f}",
+                "value": tps,
+                "timestamp": timestamp
             })
         
         # Block time issues
-        if block_time > self.thresholds["block_time_critical_ms"]:
+        if block_time > thresholds["block_time_critical_ms"]:
             events.append({
-                "type": NetworkEvent.BLOCK_TIME_HIGH.value,
+                "type": _EV_BLOCK_TIME_HIGH,
                 "severity": "warning",
                 "message": f"Block time elevated: {block_time:.0f}ms",
-                "value": block_time
+                "value": block_time,
+                "timestamp": timestamp
             })
             self.stats["high_congestion_periods"] += 1
         
         # Validator concentration
-        if validator_info.get("top_stake_pct", 0) > self.thresholds["validator_concentration_warning"]:
+        if top_stake_pct > thresholds["validator_concentration_warning"]:
             events.append({
-                "type": NetworkEvent.VALIDATOR_CONCENTRATION.value,
+                "type": _EV_VALIDATOR_CONCENTRATION,
                 "severity": "info",
-                "message": f"High validator concentration: top validator has {validator_info['top_stake_pct']:.1f}% stake",
-                "value": validator_info["top_stake_pct"]
+                "message": f"High validator concentration: top validator has {top_stake_pct:.1f}% stake",
+                "value": top_stake_pct,
+                "timestamp": timestamp
             })
         
         # Store events
-        for event in events:
-            event["timestamp"] = datetime.now(timezone.utc).isoformat()
-            self.events.append(event)
+        self.events.extend(events)
         
         return events
     
@@ -300,23 +554,12 @@ class NetworkAgent(BaseAgent):
         congestion: CongestionLevel
     ) -> int:
         """Calculate overall network health score (0-100)."""
-        score = 100
-        
-        # TPS penalty
-        if tps < self.thresholds["tps_normal_low"]:
-            score -= 20
-        elif tps > self.thresholds["tps_ddos_indicator"]:
-            score -= 30
-        
-        # Block time penalty
-        if block_time > self.thresholds["block_time_high_ms"]:
-            score -= 15
-        if block_time > self.thresholds["block_time_critical_ms"]:
-            score -= 25
-        
-        # Congestion penalty
-        score -= (congestion.value - 1) * 10
-        
+        score = (
+            100
+            - _TPS_HEALTH_PENALTY[_tps_bucket(tps, self._health_tps_edges)]
+            - _BLOCK_TIME_HEALTH_PENALTY[bisect_left(self._block_time_edges, block_time)]
+            - _CONGESTION_HEALTH_PENALTY[congestion]
+        )
         return max(0, score)
     
     async def detect_mev(self, transaction_signature: str) -> Optional[MEVAlert]:
@@ -337,19 +580,28 @@ class NetworkAgent(BaseAgent):
         await self.emit_event("network_critical", event)
     
     async def get_health_report(self) -> Dict:
-        """Generate comprehensive network health report."""
+        """
+        Generate comprehensive network health report.
+        
+        The report is rebuilt only when a new status check has landed;
+        statistics and thresholds are live references, so they stay current
+        either way. Treat the returned dict as read-only.
+        """
         if not self.current_status:
             await self.check_network_status()
         
         status = self.current_status
+        if self._report_cache is not None and self._report_cache[0] is status:
+            return self._report_cache[1]
         
-        return {
+        congestion = status.congestion_level
+        report = {
             "timestamp": status.timestamp.isoformat(),
             "health_score": status.health_score,
             "tps": status.tps,
             "block_time_ms": status.block_time_ms,
-            "congestion_level": status.congestion_level.name,
-            "congestion_value": status.congestion_level.value,
+            "congestion_level": _CONGESTION_NAMES[congestion],
+            "congestion_value": congestion.value,
             "slot_height": status.slot_height,
             "epoch": status.epoch,
             "validators": {
@@ -360,50 +612,53 @@ class NetworkAgent(BaseAgent):
             "statistics": self.stats,
             "thresholds": self.thresholds
         }
+        self._report_cache = (status, report)
+        return report
     
     async def process_task(self, task: Dict) -> Dict:
         """Process incoming tasks."""
-        task_type = task.get("type")
-        
-        if task_type == "check_status":
-            status = await self.check_network_status()
-            return {
-                "success": True,
-                "status": {
-                    "health_score": status.health_score,
-                    "tps": status.tps,
-                    "block_time_ms": status.block_time_ms,
-                    "congestion": status.congestion_level.name,
-                    "validators": status.active_validators
-                }
-            }
-        
-        elif task_type == "health_report":
-            return {
-                "success": True,
-                "report": await self.get_health_report()
-            }
-        
-        elif task_type == "detect_mev":
-            alert = await self.detect_mev(task["signature"])
-            return {
-                "success": True,
-                "mev_detected": alert is not None,
-                "alert": alert.__dict__ if alert else None
-            }
-        
-        elif task_type == "get_events":
-            limit = task.get("limit", 50)
-            return {
-                "success": True,
-                "events": self.events[-limit:]
+        handler = self._task_handlers.get(task.get("type"))
+        if handler is None:
+            return {"success": False, "error": f"Unknown task type: {task.get('type')}"}
+        return await handler(task)
+    
+    async def process_task_bytes(self, task: Dict) -> bytes:
+        """Process a task and return the result as JSON bytes for wire transport."""
+        return dumps(await self.process_task(task))
+    
+    async def _task_check_status(self, task: Dict) -> Dict:
+        status = await self.check_network_status()
+        return {
+            "success": True,
+            "status": {
+                "health_score": status.health_score,
+                "tps": status.tps,
+                "block_time_ms": status.block_time_ms,
+                "congestion": _CONGESTION_NAMES[status.congestion_level],
+                "validators": status.active_validators
             }
-        
-        elif task_type == "get_statistics":
-            return {"success": True, "statistics": self.stats}
-        
-        return {"success": False, "error": f"Unknown task type: {task_type}"}
-
-
-# Import Set for type hints
-from typing import Set
+        }
+    
+    async def _task_health_report(self, task: Dict) -> Dict:
+        return {
+            "success": True,
+            "report": await self.get_health_report()
+        }
+    
+    async def _task_detect_mev(self, task: Dict) -> Dict:
+        alert = await self.detect_mev(task["signature"])
+        return {
+            "success": True,
+            "mev_detected": alert is not None,
+            "alert": alert.to_dict() if alert else None
+        }
+    
+    async def _task_get_events(self, task: Dict) -> Dict:
+        limit = task.get("limit", 50)
+        return {
+            "success": True,
+            "events": list(islice(self.events, max(0, len(self.events) - limit), None))
+        }
+    
+    async def _task_get_statistics(self, task: Dict) -> Dict:
+        return {"success": True, "statistics": self.stats}
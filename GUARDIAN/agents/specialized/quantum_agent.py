@@ -8,13 +8,21 @@ NIST 2035 deadline tracking for harvest-now-decrypt-later attacks.
 """
 
 import asyncio
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from itertools import chain, islice
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from agents.core.base_agent import BaseAgent
 
+from ._wire import dumps
+
 
 class QuantumThreatLevel(Enum):
     """Quantum threat levels"""
@@ -34,7 +42,61 @@ class MigrationPhase(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+# Enum -> serialized value, resolved once instead of per Enum.value access
+_THREAT_LEVEL_VALUES = {t: t.value for t in QuantumThreatLevel}
+_PHASE_VALUES = {p: p.value for p in MigrationPhase}
+
+# Years until a cryptographically relevant quantum computer -> threat level.
+# bisect_left over the bucket edges (inclusive upper bounds) indexes the
+# level tables, so <=2 years is bucket 0 and >10 years is bucket 3.
+_THREAT_YEAR_EDGES = (2, 5, 10)
+_GLOBAL_THREAT_BY_BUCKET = (
+    QuantumThreatLevel.CRITICAL,
+    QuantumThreatLevel.HIGH,
+    QuantumThreatLevel.MEDIUM,
+    QuantumThreatLevel.LOW,
+)
+# Per-wallet assessments never report CRITICAL on the timeline alone
+_WALLET_THREAT_BY_BUCKET = (
+    QuantumThreatLevel.HIGH,
+    QuantumThreatLevel.HIGH,
+    QuantumThreatLevel.MEDIUM,
+    QuantumThreatLevel.LOW,
+)
+
+# Quantum score -> migration phase; bucket i covers scores in
+# [edges[i-1], edges[i]), so below 40 needs full migration.
+_PHASE_SCORE_EDGES = (40, 60, 80)
+_PHASE_BY_SCORE_BUCKET = (
+    MigrationPhase.MIGRATION,
+    MigrationPhase.HYBRID,
+    MigrationPhase.PLANNING,
+    MigrationPhase.ASSESSMENT,
+)
+
+# How long a cached calendar year is trusted before re-reading the clock
+YEAR_REFRESH_SECONDS = 3600
+
+# Assessments kept in memory; older ones are dropped, or appended to
+# config["spill_path"] as JSON lines when that is set
+MAX_ASSESSMENTS = 10_000
+
+# Wallet feature cutoffs
+HIGH_VALUE_USD = 100_000
+LONG_TERM_KEY_YEARS = 2
+HARVEST_RISK_USD = 10_000
+
+# Findings that apply to every Solana wallet
+_ED25519_VULNERABILITY = "Uses Ed25519 signatures (quantum-vulnerable)"
+_ED25519_RECOMMENDATION = "Monitor Solana's transition to quantum-resistant signatures"
+_PUBLIC_KEY_VULNERABILITY = "Public key exposed on-chain"
+_HARVEST_RECOMMENDATION = (
+    "⚠️ HARVEST RISK: Adversaries may store encrypted data now "
+    "to decrypt when quantum computers are available"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class QuantumAssessment:
     """Quantum readiness assessment for a wallet"""
     address: str
@@ -46,6 +108,17 @@ class QuantumAssessment:
     estimated_safe_until: str  # Year estimate
     harvest_risk: bool  # Harvest-now-decrypt-later risk
     timestamp: datetime
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "quantum_score": self.quantum_score,
+            "threat_level": _THREAT_LEVEL_VALUES[self.threat_level],
+            "vulnerabilities": self.vulnerabilities,
+            "recommendations": self.recommendations,
+            "migration_phase": _PHASE_VALUES[self.migration_phase],
+            "harvest_risk": self.harvest_risk
+        }
 
 
 class QuantumAgent(BaseAgent):
@@ -82,10 +155,17 @@ class QuantumAgent(BaseAgent):
             "cryptographically_relevant": 2035,  # NIST estimate
             "early_warning": 2030,
             "planning_deadline": 2028,
-            "current_year": datetime.now().year
+            "current_year": datetime.now(timezone.utc).year
         }
+        # Timeline values read on every assessment, cached as plain ints/strs
+        self._crq_year = self.quantum_timeline["cryptographically_relevant"]
+        self._safe_until = str(self._crq_year)
         
-        # Vulnerability factors
+        # Monotonic clock gating calendar-year re-reads (swappable in tests)
+        self._clock = time.monotonic
+        self._year_checked_at = self._clock()
+        
+        # Vulnerability factors (insertion order is the feature-mask column order)
         self.vulnerability_weights = {
             "ed25519_keys": 30,          # Current Solana signature scheme
             "high_value_wallet": 25,      # High-value targets
@@ -93,6 +173,19 @@ class QuantumAgent(BaseAgent):
             "institutional_wallet": 15,   # Institutional targets
             "public_key_exposed": 10      # Public key on-chain
         }
+        self._weight_vec = np.fromiter(self.vulnerability_weights.values(), dtype=np.int32)
+        # Risk every wallet starts with (Ed25519 keys + exposed public key)
+        self._base_risk = (
+            self.vulnerability_weights["ed25519_keys"]
+            + self.vulnerability_weights["public_key_exposed"]
+        )
+        
+        # Recommendations appended to every assessment
+        self._general_recommendations = (
+            "Follow NIST post-quantum cryptography standards",
+            "Monitor Solana Foundation quantum-readiness announcements",
+            f"Target migration completion before {self.quantum_timeline['planning_deadline']}"
+        )
         
         # NIST approved post-quantum algorithms
         self.pq_algorithms = {
@@ -102,7 +195,9 @@ class QuantumAgent(BaseAgent):
         }
         
         # Assessment history
-        self.assessments: List[QuantumAssessment] = []
+        self.assessments: Deque[QuantumAssessment] = deque(maxlen=MAX_ASSESSMENTS)
+        self.spill_path: Optional[str] = (config or {}).get("spill_path")
+        self._spill_file = None  # Opened on first eviction
         
         # Statistics
         self.stats = {
@@ -110,6 +205,13 @@ class QuantumAgent(BaseAgent):
             "high_risk_wallets": 0,
             "migration_plans_generated": 0
         }
+        
+        # Task type -> handler, used by process_task
+        self._task_handlers = {
+            "assess_wallet": self._task_assess_wallet,
+            "get_timeline": self._task_get_timeline,
+            "generate_roadmap": self._task_generate_roadmap,
+        }
     
     async def assess_wallet(
         self, 
@@ -132,74 +234,35 @@ class QuantumAgent(BaseAgent):
         """
         self.stats["wallets_assessed"] += 1
         
-        vulnerabilities = []
-        recommendations = []
-        risk_score = 0
+        high_value = balance_usd >= HIGH_VALUE_USD
+        long_term = key_age_years >= LONG_TERM_KEY_YEARS
         
-        # Check 1: Ed25519 vulnerability (all Solana wallets)
-        vulnerabilities.append("Uses Ed25519 signatures (quantum-vulnerable)")
-        risk_score += self.vulnerability_weights["ed25519_keys"]
-        recommendations.append("Monitor Solana's transition to quantum-resistant signatures")
-        
-        # Check 2: High-value target
-        if balance_usd >= 100_000:
-            vulnerabilities.append(f"High-value wallet (${balance_usd:,.0f})")
+        # Checks 1 and 5 (Ed25519 keys, exposed public key) apply to every wallet
+        risk_score = self._base_risk
+        if high_value:
             risk_score += self.vulnerability_weights["high_value_wallet"]
-            recommendations.append("Consider distributing funds across multiple wallets")
-        
-        # Check 3: Long-term storage risk
-        if key_age_years >= 2:
-            vulnerabilities.append(f"Keys in use for {key_age_years:.1f} years")
+        if long_term:
             risk_score += self.vulnerability_weights["long_term_storage"]
-            recommendations.append("Plan periodic key rotation")
-        
-        # Check 4: Institutional target
         if is_institutional:
-            vulnerabilities.append("Institutional wallet (high-value target)")
             risk_score += self.vulnerability_weights["institutional_wallet"]
-            recommendations.append("Implement quantum-readiness planning now")
-        
-        # Check 5: Public key exposure (all used wallets)
-        vulnerabilities.append("Public key exposed on-chain")
-        risk_score += self.vulnerability_weights["public_key_exposed"]
         
         # Calculate quantum score (inverse of risk)
         quantum_score = max(0, 100 - risk_score)
         
         # Determine threat level
-        years_until_quantum = self.quantum_timeline["cryptographically_relevant"] - datetime.now().year
-        if years_until_quantum <= 5:
-            threat_level = QuantumThreatLevel.HIGH
-        elif years_until_quantum <= 10:
-            threat_level = QuantumThreatLevel.MEDIUM
-        else:
-            threat_level = QuantumThreatLevel.LOW
+        threat_level = self._wallet_threat_level()
         
         # Harvest-now-decrypt-later risk
-        harvest_risk = balance_usd >= 10_000 or is_institutional
-        if harvest_risk:
-            recommendations.append(
-                "⚠️ HARVEST RISK: Adversaries may store encrypted data now "
-                "to decrypt when quantum computers are available"
-            )
+        harvest_risk = balance_usd >= HARVEST_RISK_USD or is_institutional
         
         # Determine migration phase
-        if quantum_score >= 80:
-            migration_phase = MigrationPhase.ASSESSMENT
-        elif quantum_score >= 60:
-            migration_phase = MigrationPhase.PLANNING
-        elif quantum_score >= 40:
-            migration_phase = MigrationPhase.HYBRID
-        else:
-            migration_phase = MigrationPhase.MIGRATION
+        migration_phase = _PHASE_BY_SCORE_BUCKET[bisect_right(_PHASE_SCORE_EDGES, quantum_score)]
+        if migration_phase is MigrationPhase.MIGRATION:
             self.stats["high_risk_wallets"] += 1
         
-        # Add general recommendations
-        recommendations.extend([
-            "Follow NIST post-quantum cryptography standards",
-            "Monitor Solana Foundation quantum-readiness announcements",
-            f"Target migration completion before {self.quantum_timeline['planning_deadline']}"
-        ])
+        vulnerabilities, recommendations = self._findings(
+            balance_usd, key_age_years, high_value, long_term, is_institutional, harvest_risk
+        )
         
         assessment = QuantumAssessment(
             address=address,
@@ -208,38 +271,177 @@ class QuantumAgent(BaseAgent):
             vulnerabilities=vulnerabilities,
             recommendations=recommendations,
             migration_phase=migration_phase,
-            estimated_safe_until=str(self.quantum_timeline["cryptographically_relevant"]),
+            estimated_safe_until=self._safe_until,
             harvest_risk=harvest_risk,
             timestamp=datetime.now(timezone.utc)
         )
         
-        self.assessments.append(assessment)
+        self._remember([assessment])
         return assessment
     
+    async def assess_wallets_bulk(
+        self,
+        addresses: List[str],
+        balance_usd: np.ndarray,
+        is_institutional: np.ndarray,
+        key_age_years: np.ndarray
+    ) -> List[QuantumAssessment]:
+        """
+        Assess many wallets at once.
+        
+        Scores, migration phases and harvest risk are computed as array
+        operations over the whole batch; Python objects are only built for
+        the returned assessments. Arguments are parallel, one entry per wallet.
+        """
+        balances = np.asarray(balance_usd, dtype=np.float64)
+        institutional = np.asarray(is_institutional, dtype=bool)
+        ages = np.asarray(key_age_years, dtype=np.float64)
+        
+        scores = self.score_wallets(balances, institutional, ages)
+        phases = np.digitize(scores, _PHASE_SCORE_EDGES)
+        harvest = (balances >= HARVEST_RISK_USD) | institutional
+        
+        self.stats["wallets_assessed"] += len(scores)
+        self.stats["high_risk_wallets"] += int(np.count_nonzero(phases == 0))
+        
+        # Shared by every wallet in the batch
+        threat_level = self._wallet_threat_level()
+        now = datetime.now(timezone.utc)
+        
+        assessments = []
+        for address, balance, age, inst, score, phase, harvest_risk in zip(
+            addresses, balances.tolist(), ages.tolist(), institutional.tolist(),
+            scores.tolist(), phases.tolist(), harvest.tolist()
+        ):
+            vulnerabilities, recommendations = self._findings(
+                balance, age, balance >= HIGH_VALUE_USD, age >= LONG_TERM_KEY_YEARS,
+                inst, harvest_risk
+            )
+            assessments.append(QuantumAssessment(
+                address=address,
+                quantum_score=score,
+                threat_level=threat_level,
+                vulnerabilities=vulnerabilities,
+                recommendations=recommendations,
+                migration_phase=_PHASE_BY_SCORE_BUCKET[phase],
+                estimated_safe_until=self._safe_until,
+                harvest_risk=harvest_risk,
+                timestamp=now
+            ))
+        
+        self._remember(assessments)
+        return assessments
+    
+    def _remember(self, assessments: List[QuantumAssessment]):
+        """Add assessments to history, spilling the ones it evicts to disk."""
+        overflow = len(self.assessments) + len(assessments) - self.assessments.maxlen
+        if overflow > 0 and self.spill_path:
+            if self._spill_file is None:
+                self._spill_file = open(self.spill_path, "ab")
+            self._spill_file.writelines(
+                dumps({**a.to_dict(), "timestamp": a.timestamp}) + b"\n"
+                for a in islice(chain(self.assessments, assessments), overflow)
+            )
+        self.assessments.extend(assessments)
+    
+    def close(self):
+        """Flush and close the assessment spill file, if one is open."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+    
+    def _findings(
+        self,
+        balance_usd: float,
+        key_age_years: float,
+        high_value: bool,
+        long_term: bool,
+        is_institutional: bool,
+        harvest_risk: bool
+    ) -> Tuple[List[str], List[str]]:
+        """Build the (vulnerabilities, recommendations) lists for one wallet."""
+        # Check 1: Ed25519 vulnerability (all Solana wallets)
+        vulnerabilities = [_ED25519_VULNERABILITY]
+        recommendations = [_ED25519_RECOMMENDATION]
+        
+        # Check 2: High-value target
+        if high_value:
+            vulnerabilities.append(f"High-value wallet (${balance_usd:,.0f})")
+            recommendations.append("Consider distributing funds across multiple wallets")
+        
+        # Check 3: Long-term storage risk
+        if long_term:
+            vulnerabilities.append(f"Keys in use for {key_age_years:.1f} years")
+            recommendations.append("Plan periodic key rotation")
+        
+        # Check 4: Institutional target
+        if is_institutional:
+            vulnerabilities.append("Institutional wallet (high-value target)")
+            recommendations.append("Implement quantum-readiness planning now")
+        
+        # Check 5: Public key exposure (all used wallets)
+        vulnerabilities.append(_PUBLIC_KEY_VULNERABILITY)
+        
+        if harvest_risk:
+            recommendations.append(_HARVEST_RECOMMENDATION)
+        
+        # Add general recommendations
+        recommendations.extend(self._general_recommendations)
+        return vulnerabilities, recommendations
+    
+    def score_wallets(
+        self,
+        balance_usd: np.ndarray,
+        is_institutional: np.ndarray,
+        key_age_years: np.ndarray
+    ) -> np.ndarray:
+        """
+        Quantum scores for many wallets at once.
+        
+        Applies the same factors as assess_wallet, but as one (N, 5)
+        feature-mask matrix multiplied by the weight vector. Arguments are
+        parallel arrays, one entry per wallet.
+        """
+        balance_usd = np.asarray(balance_usd, dtype=np.float64)
+        mask = np.ones((balance_usd.shape[0], len(self._weight_vec)), dtype=np.int32)
+        mask[:, 1] = balance_usd >= HIGH_VALUE_USD
+        mask[:, 2] = np.asarray(key_age_years) >= LONG_TERM_KEY_YEARS
+        mask[:, 3] = np.asarray(is_institutional, dtype=bool)
+        # Columns 0 and 4 (Ed25519 keys, exposed public key) apply to every wallet
+        return np.maximum(0, 100 - mask @ self._weight_vec)
+    
+    def _current_year(self) -> int:
+        """Current UTC year, re-read from the clock at most once per YEAR_REFRESH_SECONDS."""
+        now = self._clock()
+        if now - self._year_checked_at > YEAR_REFRESH_SECONDS:
+            self.quantum_timeline["current_year"] = datetime.now(timezone.utc).year
+            self._year_checked_at = now
+        return self.quantum_timeline["current_year"]
+    
+    def _wallet_threat_level(self) -> QuantumThreatLevel:
+        """Timeline-driven threat level reported on wallet assessments."""
+        return _WALLET_THREAT_BY_BUCKET[bisect_left(_THREAT_YEAR_EDGES, self._years_remaining())]
+    
+    def _years_remaining(self) -> int:
+        """Years until a cryptographically relevant quantum computer."""
+        return self._crq_year - self._current_year()
+    
     async def get_quantum_timeline(self) -> Dict:
         """Get current quantum threat timeline."""
-        current_year = datetime.now().year
+        current_year = self._current_year()
         return {
             "current_year": current_year,
             "cryptographically_relevant_quantum": self.quantum_timeline["cryptographically_relevant"],
             "years_remaining": self.quantum_timeline["cryptographically_relevant"] - current_year,
             "planning_deadline": self.quantum_timeline["planning_deadline"],
             "early_warning": self.quantum_timeline["early_warning"],
-            "threat_level": self._get_global_threat_level().value,
+            "threat_level": _THREAT_LEVEL_VALUES[self._get_global_threat_level()],
             "nist_approved_algorithms": self.pq_algorithms
         }
     
     def _get_global_threat_level(self) -> QuantumThreatLevel:
         """Calculate global quantum threat level."""
-        years_remaining = self.quantum_timeline["cryptographically_relevant"] - datetime.now().year
-        if years_remaining <= 2:
-            return QuantumThreatLevel.CRITICAL
-        elif years_remaining <= 5:
-            return QuantumThreatLevel.HIGH
-        elif years_remaining <= 10:
-            return QuantumThreatLevel.MEDIUM
-        else:
-            return QuantumThreatLevel.LOW
+        return _GLOBAL_THREAT_BY_BUCKET[bisect_left(_THREAT_YEAR_EDGES, self._years_remaining())]
     
     async def generate_migration_roadmap(self, address: str) -> Dict:
         """
@@ -312,36 +514,30 @@ class QuantumAgent(BaseAgent):
     
     async def process_task(self, task: Dict) -> Dict:
         """Process incoming tasks."""
-        task_type = task.get("type")
-        
-        if task_type == "assess_wallet":
-            assessment = await self.assess_wallet(
-                address=task["address"],
-                balance_usd=task.get("balance_usd", 0),
-                is_institutional=task.get("is_institutional", False),
-                key_age_years=task.get("key_age_years", 0)
-            )
-            return {
-                "success": True,
-                "assessment": {
-                    "address": assessment.address,
-                    "quantum_score": assessment.quantum_score,
-                    "threat_level": assessment.threat_level.value,
-                    "vulnerabilities": assessment.vulnerabilities,
-                    "recommendations": assessment.recommendations,
-                    "migration_phase": assessment.migration_phase.value,
-                    "harvest_risk": assessment.harvest_risk
-                }
-            }
-        
-        elif task_type == "get_timeline":
-            return {
-                "success": True,
-                "timeline": await self.get_quantum_timeline()
-            }
-        
-        elif task_type == "generate_roadmap":
-            roadmap = await self.generate_migration_roadmap(task["address"])
-            return {"success": True, "roadmap": roadmap}
-        
-        return {"success": False, "error": f"Unknown task type: {task_type}"}
+        handler = self._task_handlers.get(task.get("type"))
+        if handler is None:
+            return {"success": False, "error": f"Unknown task type: {task.get('type')}"}
+        return await handler(task)
+    
+    async def process_task_bytes(self, task: Dict) -> bytes:
+        """Process a task and return the result as JSON bytes for wire transport."""
+        return dumps(await self.process_task(task))
+    
+    async def _task_assess_wallet(self, task: Dict) -> Dict:
+        assessment = await self.assess_wallet(
+            address=task["address"],
+            balance_usd=task.get("balance_usd", 0),
+            is_institutional=task.get("is_institutional", False),
+            key_age_years=task.get("key_age_years", 0)
+        )
+        return {"success": True, "assessment": assessment.to_dict()}
+    
+    async def _task_get_timeline(self, task: Dict) -> Dict:
+        return {
+            "success": True,
+            "timeline": await self.get_quantum_timeline()
+        }
+    
+    async def _task_generate_roadmap(self, task: Dict) -> Dict:
+        roadmap = await self.generate_migration_roadmap(task["address"])
+        return {"success": True, "roadmap": roadmap}
@@ -0,0 +1,23 @@
+# GUARDIAN Evacuator helpers
+# Importing this module loads evacuator_agent; `import GUARDIAN` alone does not.
+from .agents.specialized.evacuator_agent import (
+    EvacuatorAgent,
+    EvacuationPlan,
+    EvacuationResult,
+    EvacuationStatus,
+    ThreatUrgency,
+    WalletAsset,
+    get_evacuator,
+    emergency_evacuate,
+)
+
+__all__ = [
+    "EvacuatorAgent",
+    "EvacuationPlan",
+    "EvacuationResult",
+    "EvacuationStatus",
+    "ThreatUrgency",
+    "WalletAsset",
+    "get_evacuator",
+    "emergency_evacuate",
+]
@@ -0,0 +1,27 @@
+# GUARDIAN SwapGuard helpers
+# Importing this module loads swapguard_agent; `import GUARDIAN` alone does not.
+from .agents.specialized.swapguard_agent import (
+    SwapGuardAgent,
+    SwapRequest,
+    SwapDecision,
+    SwapAction,
+    SwapRisk,
+    TokenAnalysis,
+    WarnFlag,
+    get_swapguard,
+    new_request_id,
+    evaluate_swap,
+)
+
+__all__ = [
+    "SwapGuardAgent",
+    "SwapRequest",
+    "SwapDecision",
+    "SwapAction",
+    "SwapRisk",
+    "TokenAnalysis",
+    "WarnFlag",
+    "get_swapguard",
+    "new_request_id",
+    "evaluate_swap",
+]
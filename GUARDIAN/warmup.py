@@ -0,0 +1,53 @@
+"""
+GUARDIAN Warmup - Populate on-disk caches after install
+
+Imports every elite agent module and calls each JIT kernel once with a
+tiny synthetic input, so the numba cache (.nbi/.nbc files under
+NUMBA_CACHE_DIR) exists before the first real request arrives.
+
+Run once after installing dependencies, e.g. in a Dockerfile:
+
+    RUN pip install -r agents/requirements.txt && python -m GUARDIAN.warmup
+"""
+import importlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Tuple
+
+from .agents.specialized import _LAZY
+
+
+# (module path, callable name, sample args) for every cached JIT kernel
+WARMUP_TARGETS: Tuple[Tuple[str, str, Tuple[Any, ...]], ...] = (
+    ("GUARDIAN.agents.specialized.lazarus_agent", "_warm_peel_score", ()),
+    ("GUARDIAN.agents.specialized.swapguard_agent", "_warm_score_rows", ()),
+)
+
+
+def _warm(target: Tuple[str, str, Tuple[Any, ...]]) -> str:
+    """Import a module and call one kernel so its compiled form is cached"""
+    module_path, callable_name, sample_args = target
+    module = importlib.import_module(module_path)
+    getattr(module, callable_name)(*sample_args)
+    return f"{module_path}.{callable_name}"
+
+
+def main() -> int:
+    """Warm every agent module; returns a process exit code"""
+    modules = sorted(set(_LAZY.values()))
+    for module in modules:
+        importlib.import_module(module, "GUARDIAN.agents.specialized")
+        print(f"✅ Imported {module.lstrip('.')}")
+
+    if WARMUP_TARGETS:
+        # Kernels compile independently, so fan them out across processes
+        with ProcessPoolExecutor() as pool:
+            for name in pool.map(_warm, WARMUP_TARGETS):
+                print(f"✅ Compiled {name}")
+
+    print(f"🔥 Warmup complete: {len(modules)} modules, {len(WARMUP_TARGETS)} kernels")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,21 +4,64 @@ GUARDIAN Telegram Bot - Real-time alerts and commands
 import asyncio
 import json
 import sys
+import time
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import httpx
 import structlog
 
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True  # Optional: multiplex polls and sends over one connection
+except ImportError:
+    _HTTP2 = False
+
 from core.database import get_db
 from core.config import config
 from core.embeddings import get_scorer
 
 logger = structlog.get_logger()
 
+POLL_TIMEOUT_S = 50         # Telegram holds getUpdates open this long when idle
+POLL_ERROR_BACKOFF_S = 1.0  # Pause after a failed poll so errors don't spin
+DB_CACHE_TTL_S = 10.0       # How stale command answers built from DB reads may get
+SCORING_DATA_TTL_S = 30.0   # How often /score's blacklist set and patterns are rebuilt
+
+# Severity bands: below 40, 40-59, 60-79, 80 and up
+_SEVERITY_EDGES = (40, 60, 80)
+_SEVERITY_EMOJI = ("🟢", "🟡", "🟠", "🔴")
+_ACTIVE_THREAT_EMOJI = ("🟡", "🟡", "🟠", "🔴")  # An active threat is never shown green
+SILENT_ALERT_BELOW = 60  # Alerts under this severity are delivered without a notification sound
+
+
+def _severity_emoji(severity: float, palette: Tuple[str, ...] = _SEVERITY_EMOJI) -> str:
+    """Colour dot for a 0-100 severity or risk score"""
+    return palette[bisect_right(_SEVERITY_EDGES, severity)]
+
+
+# Reply to /start and /help
+_START_MESSAGE = """
+🛡️ *GUARDIAN Bot*
+_Solana Immune System_
+
+I'll keep you updated on threats detected in the Solana ecosystem.
+
+*Commands:*
+/status - System status
+/threats - Recent threats
+/blacklist - Known bad actors
+/score <address> - Risk assessment
+/alert on|off - Toggle alerts
+/help - Show help
+
+Stay safe! 🔒
+"""
+
 
 class GuardianTelegramBot:
     """
@@ -37,17 +80,74 @@ class GuardianTelegramBot:
         self.token = token
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{token}"
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # One pooled keep-alive client for polling and every send, so only the
+        # first request pays the TCP+TLS handshake. Read timeout must outlast
+        # the long poll.
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(POLL_TIMEOUT_S + 10.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0,
+            ),
+            http2=_HTTP2,
+        )
         self.db = get_db()
         self.scorer = get_scorer()
         self.running = False
         self.last_update_id = 0
         self.alerts_enabled = True
         
+        # Command dispatch tables: handlers taking (chat_id) and (chat_id, args)
+        self._handlers = {
+            "/start": self.cmd_start,
+            "/status": self.cmd_status,
+            "/threats": self.cmd_threats,
+            "/blacklist": self.cmd_blacklist,
+            "/help": self.cmd_help,
+        }
+        self._handlers_args = {
+            "/score": self.cmd_score,
+            "/alert": self.cmd_alert,
+        }
+        
+        # DB read cache: key -> (time.monotonic() when fetched, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
         logger.info("Telegram bot initialized")
     
-    async def send_message(self, text: str, chat_id: str = None, parse_mode: str = "Markdown"):
-        """Send a message"""
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return fn()'s result, reusing a stored one younger than ttl seconds"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        value = fn()
+        self._cache[key] = (now, value)
+        return value
+    
+    def _blacklist_set(self) -> FrozenSet[str]:
+        """Blacklisted addresses as a frozenset, shared by /score calls until it expires"""
+        return self._cached(
+            "blacklist_set",
+            SCORING_DATA_TTL_S,
+            lambda: frozenset(b["address"] for b in self.db.get_blacklist()),
+        )
+    
+    def _scoring_patterns(self) -> List[Dict]:
+        """Confident learned patterns for /score, shared until they expire"""
+        return self._cached(
+            "patterns", SCORING_DATA_TTL_S, lambda: self.db.get_patterns(min_confidence=0.5)
+        )
+    
+    async def send_message(
+        self,
+        text: str,
+        chat_id: str = None,
+        parse_mode: str = "Markdown",
+        silent: bool = False,
+    ):
+        """Send a message (silent: deliver without a notification sound)"""
         target = chat_id or self.chat_id
         if not target:
             logger.warning("No chat_id specified")
@@ -59,7 +159,8 @@ class GuardianTelegramBot:
                 json={
                     "chat_id": target,
                     "text": text,
-                    "parse_mode": parse_mode
+                    "parse_mode": parse_mode,
+                    "disable_notification": silent,
                 }
             )
         except Exception as e:
@@ -67,13 +168,28 @@ class GuardianTelegramBot:
     
     async def send_alert(self, threat: dict):
         """Send threat alert"""
+        await self.send_alerts([threat])
+    
+    async def send_alerts(self, threats: List[dict]):
+        """Send a burst of threat alerts concurrently, low-severity ones silently"""
         if not self.alerts_enabled or not self.chat_id:
             return
         
+        now = datetime.now().strftime('%H:%M:%S')
+        await asyncio.gather(*(
+            self.send_message(
+                self._alert_message(threat, now),
+                silent=threat.get("severity", 0) < SILENT_ALERT_BELOW,
+            )
+            for threat in threats
+        ))
+    
+    def _alert_message(self, threat: dict, time_str: str) -> str:
+        """Markdown body of one threat alert"""
         severity = threat.get("severity", 0)
-        emoji = "🔴" if severity >= 80 else "🟠" if severity >= 60 else "🟡" if severity >= 40 else "🟢"
+        emoji = _severity_emoji(severity)
         
-        message = f"""
+        return f"""
 {emoji} *GUARDIAN ALERT*
 
 *Type:* `{threat.get('threat_type', 'Unknown')}`
@@ -83,9 +199,8 @@ class GuardianTelegramBot:
 {threat.get('description', '')}
 
 *Detected by:* {threat.get('detected_by', 'Unknown')}
-*Time:* {datetime.now().strftime('%H:%M:%S')}
+*Time:* {time_str}
 """
-        await self.send_message(message)
     
     async def handle_command(self, message: dict):
         """Handle incoming command"""
@@ -99,58 +214,38 @@ class GuardianTelegramBot:
         command = parts[0].lower().replace("@", " ").split()[0]
         args = parts[1:] if len(parts) > 1 else []
         
-        if command == "/start":
-            await self.cmd_start(chat_id)
-        elif command == "/status":
-            await self.cmd_status(chat_id)
-        elif command == "/threats":
-            await self.cmd_threats(chat_id)
-        elif command == "/blacklist":
-            await self.cmd_blacklist(chat_id)
-        elif command == "/score":
-            await self.cmd_score(chat_id, args)
-        elif command == "/alert":
-            await self.cmd_alert(chat_id, args)
-        elif command == "/help":
-            await self.cmd_help(chat_id)
+        handler = self._handlers.get(command)
+        if handler is not None:
+            await handler(chat_id)
+            return
+        
+        handler = self._handlers_args.get(command)
+        if handler is not None:
+            await handler(chat_id, args)
     
     async def cmd_start(self, chat_id: str):
         """Welcome message"""
-        message = """
-🛡️ *GUARDIAN Bot*
-_Solana Immune System_
-
-I'll keep you updated on threats detected in the Solana ecosystem.
-
-*Commands:*
-/status - System status
-/threats - Recent threats
-/blacklist - Known bad actors
-/score <address> - Risk assessment
-/alert on|off - Toggle alerts
-/help - Show help
-
-Stay safe! 🔒
-"""
-        await self.send_message(message, chat_id)
+        await self.send_message(_START_MESSAGE, chat_id)
         self.chat_id = chat_id  # Save chat ID for alerts
     
     async def cmd_status(self, chat_id: str):
         """System status"""
-        stats = self.db.get_threat_stats()
-        agents = self.db.get_all_agent_stats()
+        stats = self._cached("threat_stats", DB_CACHE_TTL_S, self.db.get_threat_stats)
+        agents = self._cached("agent_stats", DB_CACHE_TTL_S, self.db.get_all_agent_stats)
+        blacklist = self._cached("blacklist", DB_CACHE_TTL_S, self.db.get_blacklist)
+        by_status = stats.get('by_status', {})
         
         message = f"""
 📊 *GUARDIAN Status*
 
 *Threats:*
-├ Active: {stats.get('by_status', {}).get('active', 0)}
-├ Resolved: {stats.get('by_status', {}).get('resolved', 0)}
+├ Active: {by_status.get('active', 0)}
+├ Resolved: {by_status.get('resolved', 0)}
 ├ Last 24h: {stats.get('last_24h', 0)}
 └ Avg Severity: {stats.get('avg_severity', 0):.1f}
 
 *Agents:* {len(agents)} active
-*Blacklisted:* {len(self.db.get_blacklist())} addresses
+*Blacklisted:* {len(blacklist)} addresses
 *Network:* {config.network}
 *Alerts:* {'✅ ON' if self.alerts_enabled else '❌ OFF'}
 
@@ -166,31 +261,34 @@ _Updated: {datetime.now().strftime('%H:%M:%S')}_
             await self.send_message("✅ No active threats!", chat_id)
             return
         
-        message = "🚨 *Recent Threats*\n\n"
-        
+        entries = []
         for t in threats:
             sev = t.get('severity', 0)
-            emoji = "🔴" if sev >= 80 else "🟠" if sev >= 60 else "🟡"
-            message += f"{emoji} *{t['threat_type']}* - {sev:.0f}\n"
-            message += f"└ `{(t.get('target_address') or 'N/A')[:16]}...`\n\n"
+            emoji = _severity_emoji(sev, _ACTIVE_THREAT_EMOJI)
+            entries.append(
+                f"{emoji} *{t['threat_type']}* - {sev:.0f}\n"
+                f"└ `{(t.get('target_address') or 'N/A')[:16]}...`\n\n"
+            )
         
-        await self.send_message(message, chat_id)
+        await self.send_message("🚨 *Recent Threats*\n\n" + "".join(entries), chat_id)
     
     async def cmd_blacklist(self, chat_id: str):
         """Show blacklist"""
-        blacklist = self.db.get_blacklist(min_severity=70)[:10]
+        blacklist = self._cached(
+            "blacklist_high", DB_CACHE_TTL_S, lambda: self.db.get_blacklist(min_severity=70)
+        )[:10]
         
         if not blacklist:
             await self.send_message("📋 Blacklist is empty", chat_id)
             return
         
-        message = "🚫 *High-Risk Blacklist*\n\n"
+        entries = [
+            f"• `{b['address'][:16]}...` ({b['severity']})\n"
+            f"  _{b.get('reason', 'No reason')[:30]}_\n\n"
+            for b in blacklist
+        ]
         
-        for b in blacklist:
-            message += f"• `{b['address'][:16]}...` ({b['severity']})\n"
-            message += f"  _{b.get('reason', 'No reason')[:30]}_\n\n"
-        
-        await self.send_message(message, chat_id)
+        await self.send_message("🚫 *High-Risk Blacklist*\n\n" + "".join(entries), chat_id)
     
     async def cmd_score(self, chat_id: str, args: list):
         """Score an address"""
@@ -209,13 +307,11 @@ _Updated: {datetime.now().strftime('%H:%M:%S')}_
             "evidence": {}
         }
         
-        blacklist = set(b["address"] for b in self.db.get_blacklist())
-        patterns = self.db.get_patterns(min_confidence=0.5)
-        
-        result = self.scorer.score_threat(threat, blacklist, patterns)
+        result = self.scorer.score_threat(threat, self._blacklist_set(), self._scoring_patterns())
         score = result["final_score"]
+        components = result['component_scores']
         
-        emoji = "🔴" if score >= 80 else "🟠" if score >= 60 else "🟡" if score >= 40 else "🟢"
+        emoji = _severity_emoji(score)
         
         message = f"""
 {emoji} *Risk Assessment*
@@ -225,9 +321,9 @@ _Updated: {datetime.now().strftime('%H:%M:%S')}_
 *Recommendation:* {result['recommendation']}
 
 *Components:*
-├ ML Score: {result['component_scores'].get('ml_score', 0):.1f}
-├ Blacklist: {'⚠️ MATCH' if result['component_scores'].get('blacklist_match', 0) > 0 else '✅ Clean'}
-└ Anomaly: {result['component_scores'].get('anomaly', 0):.1f}
+├ ML Score: {components.get('ml_score', 0):.1f}
+├ Blacklist: {'⚠️ MATCH' if components.get('blacklist_match', 0) > 0 else '✅ Clean'}
+└ Anomaly: {components.get('anomaly', 0):.1f}
 """
         await self.send_message(message, chat_id)
     
@@ -251,19 +347,23 @@ _Updated: {datetime.now().strftime('%H:%M:%S')}_
         await self.cmd_start(chat_id)
     
     async def poll_updates(self):
-        """Poll for new messages"""
+        """Long-poll for new messages (returns as soon as one arrives)"""
         try:
             response = await self.client.get(
                 f"{self.base_url}/getUpdates",
                 params={
                     "offset": self.last_update_id + 1,
-                    "timeout": 30
+                    "timeout": POLL_TIMEOUT_S,
+                    "allowed_updates": json.dumps(["message"]),
                 }
             )
             
             data = response.json()
             
-            if data.get("ok") and data.get("result"):
+            if not data.get("ok"):
+                logger.error("Poll rejected", error=data.get("description"))
+                await asyncio.sleep(POLL_ERROR_BACKOFF_S)
+            elif data.get("result"):
                 for update in data["result"]:
                     self.last_update_id = update["update_id"]
                     
@@ -272,15 +372,16 @@ _Updated: {datetime.now().strftime('%H:%M:%S')}_
                         
         except Exception as e:
             logger.error("Poll error", error=str(e))
+            await asyncio.sleep(POLL_ERROR_BACKOFF_S)
     
     async def start(self):
         """Start the bot"""
         self.running = True
         logger.info("Telegram bot starting...")
         
+        # No sleep between polls: getUpdates itself blocks until there is work
         while self.running:
             await self.poll_updates()
-            await asyncio.sleep(1)
     
     async def stop(self):
         """Stop the bot"""
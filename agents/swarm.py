@@ -237,6 +237,11 @@ async def main():
     # Handle shutdown signals
     loop = asyncio.get_event_loop()
     
+    # Start tasks eagerly so coroutines that finish without blocking
+    # never go through the scheduler (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    
     def shutdown_handler():
         logger.info("Received shutdown signal")
         asyncio.create_task(swarm.stop())
@@ -257,4 +262,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Optional: uvloop's faster event loop when installed
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    (uvloop.run if uvloop else asyncio.run)(main())
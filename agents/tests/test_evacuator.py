@@ -0,0 +1,170 @@
+"""
+Tests for the GUARDIAN EVACUATOR agent
+"""
+import pytest
+import sys
+import os
+
+# Add repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GUARDIAN.agents.specialized.evacuator_agent import (
+    ASSOCIATED_TOKEN_PROGRAM_ID,
+    SYSTEM_PROGRAM_ID,
+    TOKEN_PROGRAM_ID,
+    AssetType,
+    EvacuatorAgent,
+    WalletAsset,
+    _make_transfer_builder,
+)
+
+SOURCE_WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+SAFE_WALLET = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+TOKEN_ACCOUNT = "4Nd1mBQtrMJVYVfKf2PJy9NZUZdTAsp7D4xWLs4gDB4T"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+@pytest.fixture
+def Pubkey():
+    return pytest.importorskip("solders.pubkey").Pubkey
+
+
+@pytest.fixture
+def usdc_asset():
+    return WalletAsset(
+        asset_type=AssetType.SPL_TOKEN,
+        mint=USDC_MINT,
+        symbol="USDC",
+        balance=1.005,  # 1.005 * 10**6 is 1004999.99... as a float
+        decimals=6,
+        value_usd=1.005,
+        token_account=TOKEN_ACCOUNT,
+        token_program=TOKEN_PROGRAM_ID,
+        amount_raw=1_005_000,
+    )
+
+
+def token_dict(**overrides):
+    token = {
+        "type": AssetType.SPL_TOKEN.value,
+        "mint": USDC_MINT,
+        "symbol": "USDC",
+        "balance": 5.0,
+        "decimals": 6,
+        "value_usd": 5.0,
+        "token_account": TOKEN_ACCOUNT,
+        "is_nft": False,
+        "token_program": TOKEN_PROGRAM_ID,
+        "amount_raw": 5_000_000,
+    }
+    token.update(overrides)
+    return token
+
+
+class TestTransferInstructions:
+    """Tests for the prebuilt SPL token transfer instructions"""
+
+    def test_create_idempotent_accounts(self, Pubkey, usdc_asset):
+        create, _ = _make_transfer_builder(usdc_asset, SOURCE_WALLET, SAFE_WALLET)()
+
+        owner = Pubkey.from_string(SOURCE_WALLET)
+        safe = Pubkey.from_string(SAFE_WALLET)
+        mint = Pubkey.from_string(USDC_MINT)
+        token_program = Pubkey.from_string(TOKEN_PROGRAM_ID)
+        ata_program = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
+        ata, _ = Pubkey.find_program_address([bytes(safe), bytes(token_program), bytes(mint)], ata_program)
+
+        assert create.program_id == ata_program
+        assert bytes(create.data) == b"\x01"
+        assert [(m.pubkey, m.is_signer, m.is_writable) for m in create.accounts] == [
+            (owner, True, True),  # payer
+            (ata, False, True),
+            (safe, False, False),  # ATA owner is the destination wallet
+            (mint, False, False),
+            (Pubkey.from_string(SYSTEM_PROGRAM_ID), False, False),
+            (token_program, False, False),
+        ]
+
+    def test_transfer_checked_data_and_accounts(self, Pubkey, usdc_asset):
+        create, transfer = _make_transfer_builder(usdc_asset, SOURCE_WALLET, SAFE_WALLET)()
+
+        assert transfer.program_id == Pubkey.from_string(TOKEN_PROGRAM_ID)
+        assert bytes(transfer.data) == b"\x0c" + (1_005_000).to_bytes(8, "little") + b"\x06"
+        assert [(m.pubkey, m.is_signer, m.is_writable) for m in transfer.accounts] == [
+            (Pubkey.from_string(TOKEN_ACCOUNT), False, True),
+            (Pubkey.from_string(USDC_MINT), False, False),
+            (create.accounts[1].pubkey, False, True),
+            (Pubkey.from_string(SOURCE_WALLET), True, False),  # authority
+        ]
+
+    def test_builder_returns_fresh_lists(self, Pubkey, usdc_asset):
+        build_ixs = _make_transfer_builder(usdc_asset, SOURCE_WALLET, SAFE_WALLET)
+
+        first, second = build_ixs(), build_ixs()
+
+        assert first == second
+        assert first is not second
+
+
+class TestEvacuationPlan:
+    """Tests for evacuation planning"""
+
+    @pytest.mark.asyncio
+    async def test_unbuildable_asset_does_not_abort_plan(self):
+        agent = EvacuatorAgent()
+
+        async def analyze_wallet(wallet):
+            return {
+                "assets": [
+                    token_dict(symbol="BROKEN", token_account=None),
+                    token_dict(),
+                ],
+                "approvals": [],
+            }
+
+        agent.analyze_wallet = analyze_wallet
+
+        plan = await agent.create_evacuation_plan(SOURCE_WALLET, SAFE_WALLET)
+
+        assert [a.symbol for a in plan.token_assets] == ["BROKEN", "USDC"]
+        assert plan.token_assets[0].build_ixs is None  # Retried at send time
+
+
+class TestWalletCache:
+    """Tests for the short-lived wallet account cache"""
+
+    @pytest.fixture
+    def agent(self):
+        agent = EvacuatorAgent({"wallet_cache_max": 2})
+        agent.fetched = []
+
+        async def batch_rpc(calls):
+            agent.fetched.append(calls[0][1][0])
+            return [{"value": 0}, {"value": []}, {"value": []}]
+
+        agent._batch_rpc = batch_rpc
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_is_cached(self, agent):
+        await agent._get_wallet_accounts(SOURCE_WALLET)
+        await agent._get_wallet_accounts(SOURCE_WALLET)
+
+        assert agent.fetched == [SOURCE_WALLET]
+
+    @pytest.mark.asyncio
+    async def test_oldest_evicted_past_cap(self, agent):
+        for wallet in (SOURCE_WALLET, SAFE_WALLET, TOKEN_ACCOUNT):
+            await agent._get_wallet_accounts(wallet)
+
+        assert list(agent._wallet_cache) == [SAFE_WALLET, TOKEN_ACCOUNT]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_evicted_on_write(self, agent):
+        await agent._get_wallet_accounts(SOURCE_WALLET)
+        results, written = agent._wallet_cache[SOURCE_WALLET]
+        agent._wallet_cache[SOURCE_WALLET] = (results, written - agent.wallet_cache_ttl_s)
+
+        await agent._get_wallet_accounts(SAFE_WALLET)
+
+        assert list(agent._wallet_cache) == [SAFE_WALLET]
@@ -0,0 +1,77 @@
+"""
+Tests for the GUARDIAN HONEYPOT agent
+"""
+import asyncio
+import pytest
+import sys
+import os
+from datetime import datetime, timezone
+
+# Add repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GUARDIAN.agents.specialized.honeypot_agent import (
+    HoneypotAgent,
+    HoneypotDeployment,
+    HoneypotType,
+)
+
+ATTACKER_A = "AttackerA1111111111111111111111111111111111"
+ATTACKER_B = "AttackerB1111111111111111111111111111111111"
+
+
+@pytest.fixture
+def agent():
+    agent = HoneypotAgent()
+    agent.config["event_flush_seconds"] = 0
+    agent.deployments["HP-TEST"] = HoneypotDeployment(
+        id="HP-TEST",
+        address="HoneyTest",
+        honeypot_type=HoneypotType.LOW_VALUE,
+        bait_amount_sol=0.5,
+        deployed_at=datetime.now(timezone.utc),
+    )
+    return agent
+
+
+def emitted_addresses(emitted, event_type, key):
+    return [event[key] for kind, payload in emitted if kind == event_type for event in payload["events"]]
+
+
+class TestSwarmEvents:
+    """Tests for the coalesced swarm event flush"""
+
+    @pytest.mark.asyncio
+    async def test_events_queued_during_emit_are_flushed(self, agent):
+        emitted = []
+
+        async def emit_event(event_type, data):
+            emitted.append((event_type, data))
+            await asyncio.sleep(0.01)
+
+        agent.emit_event = emit_event
+
+        await agent._process_interaction("HP-TEST", {"from_address": ATTACKER_A})
+        await asyncio.sleep(0.005)  # Flush task is now awaiting emit_event
+        await agent._process_interaction("HP-TEST", {"from_address": ATTACKER_B})
+        await asyncio.wait_for(agent._event_flush_task, timeout=1)
+
+        assert agent._event_queue == []
+        assert emitted_addresses(emitted, "attacker_caught", "attacker") == [ATTACKER_A, ATTACKER_B]
+        assert emitted_addresses(emitted, "blacklist_address", "address") == [ATTACKER_A, ATTACKER_B]
+
+    @pytest.mark.asyncio
+    async def test_emit_failure_keeps_other_types(self, agent):
+        emitted = []
+
+        async def emit_event(event_type, data):
+            if event_type == "attacker_caught":
+                raise ConnectionError("bus down")
+            emitted.append((event_type, data))
+
+        agent.emit_event = emit_event
+
+        await agent._process_interaction("HP-TEST", {"from_address": ATTACKER_A})
+        await asyncio.wait_for(agent._event_flush_task, timeout=1)
+
+        assert emitted_addresses(emitted, "blacklist_address", "address") == [ATTACKER_A]
@@ -0,0 +1,94 @@
+"""
+Tests for the GUARDIAN NETWORK agent
+"""
+import pytest
+import sys
+import os
+
+# Add repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GUARDIAN.agents.specialized.network_agent import CongestionLevel, NetworkAgent
+
+SAMPLE = {"samplePeriodSecs": 60, "numTransactions": 180_000, "numSlots": 150}
+VOTE_ACCOUNTS = {"current": [{"activatedStake": 60}, {"activatedStake": 40}]}
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeRPC:
+    """Answers each posted batch with the next queued reply body"""
+
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+
+    async def post(self, url, json):
+        body = self.bodies.pop(0)
+        return FakeResponse(body(json) if callable(body) else body)
+
+
+def batch_reply(samples):
+    results = [samples, 300_000_000, {"epoch": 600}, VOTE_ACCOUNTS]
+    return lambda payload: [{"id": call["id"], "result": results[call["id"]]} for call in reversed(payload)]
+
+
+@pytest.fixture
+def agent():
+    return NetworkAgent({"rpc_url": "https://rpc.example"})
+
+
+class TestNetworkStatus:
+    """Tests for live network status checks"""
+
+    @pytest.mark.asyncio
+    async def test_batch_metrics(self, agent):
+        agent._rpc_client = FakeRPC(batch_reply([SAMPLE]))
+
+        status = await agent.check_network_status()
+
+        assert status.tps == 3000
+        assert status.block_time_ms == 400
+        assert status.active_validators == 2
+        assert status.top_validator_stake_pct == 60
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_keeps_previous_status(self, agent):
+        agent._rpc_client = FakeRPC(
+            batch_reply([SAMPLE]),
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Batch requests disabled"}},
+        )
+        previous = await agent.check_network_status()
+
+        status = await agent.check_network_status()
+
+        assert status is previous
+        assert agent.stats["rpc_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_samples_report_unknown(self, agent):
+        agent._rpc_client = FakeRPC(batch_reply([]))
+
+        status = await agent.check_network_status()
+
+        assert status.congestion_level == CongestionLevel.UNKNOWN
+        assert (await agent.get_health_report())["congestion_level"] == "UNKNOWN"
+
+    @pytest.mark.asyncio
+    async def test_rpc_error_does_not_raise(self, agent):
+        agent._rpc_client = FakeRPC(
+            lambda payload: [{"id": call["id"], "error": {"message": "busy"}} for call in payload]
+        )
+
+        status = await agent.check_network_status()
+
+        assert status.congestion_level == CongestionLevel.UNKNOWN
+        assert agent.stats["rpc_failures"] == 1
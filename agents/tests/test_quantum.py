@@ -0,0 +1,151 @@
+"""
+Tests for the GUARDIAN QUANTUM agent
+"""
+import json
+import pytest
+import sys
+import os
+from collections import deque
+
+import numpy as np
+
+# Add repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GUARDIAN.agents.specialized.quantum_agent import MigrationPhase, QuantumAgent
+
+# (balance_usd, is_institutional, key_age_years) covering every feature
+# combination and each cutoff from both sides
+WALLETS = [
+    (0.0, False, 0.0),
+    (9_999.99, False, 1.99),
+    (10_000.0, False, 2.0),  # Harvest and long-term cutoffs exactly
+    (99_999.99, True, 0.5),
+    (100_000.0, False, 0.0),  # High-value cutoff exactly
+    (100_000.0, True, 0.0),
+    (250_000.0, False, 5.0),
+    (5_000.0, True, 3.0),
+    (1_000_000.0, True, 10.0),
+]
+
+
+def reweight(agent, **weights):
+    """Change vulnerability weights, keeping the derived vectors in step"""
+    agent.vulnerability_weights.update(weights)
+    agent._weight_vec = np.fromiter(agent.vulnerability_weights.values(), dtype=np.int32)
+    agent._base_risk = (
+        agent.vulnerability_weights["ed25519_keys"]
+        + agent.vulnerability_weights["public_key_exposed"]
+    )
+
+
+def comparable(assessment):
+    return (
+        assessment.to_dict(),
+        assessment.threat_level,
+        assessment.estimated_safe_until,
+        type(assessment.quantum_score),
+    )
+
+
+async def assess_both(wallets, **weights):
+    """Assess wallets one at a time and in bulk, each on a fresh agent"""
+    scalar_agent, bulk_agent = QuantumAgent(), QuantumAgent()
+    if weights:
+        reweight(scalar_agent, **weights)
+        reweight(bulk_agent, **weights)
+
+    addresses = [f"Wallet{i}" for i in range(len(wallets))]
+    scalar = [
+        await scalar_agent.assess_wallet(address, balance, institutional, age)
+        for address, (balance, institutional, age) in zip(addresses, wallets)
+    ]
+    balances, institutional, ages = (np.array(column) for column in zip(*wallets))
+    bulk = await bulk_agent.assess_wallets_bulk(addresses, balances, institutional, ages)
+    return scalar_agent, scalar, bulk_agent, bulk
+
+
+class TestBulkAssessment:
+    """Tests for bulk wallet assessment against assess_wallet"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_matches_scalar(self):
+        scalar_agent, scalar, bulk_agent, bulk = await assess_both(WALLETS)
+
+        assert [comparable(a) for a in bulk] == [comparable(a) for a in scalar]
+        assert bulk_agent.stats == scalar_agent.stats
+        assert bulk_agent.stats["high_risk_wallets"] > 0
+
+    @pytest.mark.asyncio
+    async def test_phase_edges(self):
+        """Scores exactly on 40/60/80 land in the higher phase on both paths"""
+        # Default weights: no factors scores 60, long-term keys alone 40
+        _, scalar, _, bulk = await assess_both([(0.0, False, 0.0), (0.0, False, 2.0)])
+        # Lighter Ed25519 weight: no factors scores 80
+        _, scalar_80, _, bulk_80 = await assess_both([(0.0, False, 0.0)], ed25519_keys=10)
+
+        for assessments in ((scalar + scalar_80), (bulk + bulk_80)):
+            assert [(a.quantum_score, a.migration_phase) for a in assessments] == [
+                (60, MigrationPhase.PLANNING),
+                (40, MigrationPhase.HYBRID),
+                (80, MigrationPhase.ASSESSMENT),
+            ]
+
+    def test_score_wallets(self):
+        agent = QuantumAgent()
+        balances, institutional, ages = (np.array(column) for column in zip(*WALLETS))
+
+        scores = agent.score_wallets(balances, institutional, ages)
+
+        assert scores.tolist() == [
+            100 - 40 - 25 * (b >= 100_000) - 20 * (a >= 2) - 15 * i
+            for b, i, a in WALLETS
+        ]
+
+
+class TestAssessmentSpill:
+    """Tests for spilling evicted assessments to disk"""
+
+    @pytest.fixture
+    def agent(self, tmp_path):
+        agent = QuantumAgent({"spill_path": str(tmp_path / "spill.jsonl")})
+        agent.assessments = deque(maxlen=3)
+        yield agent
+        agent.close()
+
+    def spilled(self, agent):
+        agent._spill_file.flush()
+        with open(agent.spill_path, "rb") as f:
+            return [json.loads(line) for line in f]
+
+    @pytest.mark.asyncio
+    async def test_spills_exactly_the_evicted(self, agent):
+        first = [await agent.assess_wallet(f"Single{i}", 50_000.0) for i in range(2)]
+        bulk = await agent.assess_wallets_bulk(
+            [f"Bulk{i}" for i in range(4)], np.zeros(4), np.zeros(4, dtype=bool), np.zeros(4)
+        )
+
+        spilled = self.spilled(agent)
+
+        assert [s["address"] for s in spilled] == ["Single0", "Single1", "Bulk0"]
+        assert list(agent.assessments) == bulk[1:]
+        assert spilled[0]["quantum_score"] == first[0].quantum_score
+        assert spilled[0]["harvest_risk"] is True
+        assert "timestamp" in spilled[0]
+
+    @pytest.mark.asyncio
+    async def test_batch_larger_than_history(self, agent):
+        await agent.assess_wallet("Single0")
+        await agent.assess_wallets_bulk(
+            [f"Bulk{i}" for i in range(5)], np.zeros(5), np.zeros(5, dtype=bool), np.zeros(5)
+        )
+
+        assert [s["address"] for s in self.spilled(agent)] == ["Single0", "Bulk0", "Bulk1"]
+        assert [a.address for a in agent.assessments] == ["Bulk2", "Bulk3", "Bulk4"]
+
+    @pytest.mark.asyncio
+    async def test_nothing_spilled_until_full(self, agent):
+        for i in range(3):
+            await agent.assess_wallet(f"Single{i}")
+
+        assert agent._spill_file is None
@@ -0,0 +1,348 @@
+"""
+Tests for the GUARDIAN SwapGuard agent
+"""
+import asyncio
+import copy
+import random
+import pytest
+import sys
+import os
+
+# Add repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GUARDIAN.agents.specialized import swapguard_agent
+from GUARDIAN.agents.specialized.swapguard_agent import (
+    SwapGuardAgent,
+    SwapRequest,
+    SwapAction,
+    SwapRisk,
+    TokenAnalysis,
+    WRAPPED_SOL_MINT,
+    UNANALYZED_CONFIDENCE,
+)
+
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+WBTC_MINT = "3NZ9JMVBmGAqocybic2c7LQCJScmgsAZ6vQqTDzcqmJh"
+UNKNOWN_MINT = "Unknown1111111111111111111111111111111111111"
+
+
+def make_analysis(mint=UNKNOWN_MINT, **overrides) -> TokenAnalysis:
+    """A clean, liquid, unverified token analysis"""
+    fields = dict(
+        mint=mint,
+        symbol="TKN",
+        name="Token",
+        overall_risk=0.0,
+        honeypot_risk=10.0,
+        rugpull_risk=10.0,
+        liquidity_risk=10.0,
+        concentration_risk=10.0,
+        is_honeypot=False,
+        is_blacklisted=False,
+        has_mint_authority=False,
+        has_freeze_authority=False,
+        is_verified=False,
+        liquidity_usd=50_000.0,
+        price_impact_1sol=0.5,
+        can_sell=True,
+        top_holder_pct=5.0,
+        holder_count=1_000,
+        has_social=True,
+        age_hours=720.0,
+    )
+    fields.update(overrides)
+    return TokenAnalysis(**fields)
+
+
+def make_request(amount, input_mint=WRAPPED_SOL_MINT, output_mint=UNKNOWN_MINT, id="req") -> SwapRequest:
+    return SwapRequest(
+        id=id,
+        user_wallet="User111111111111111111111111111111111111111",
+        input_mint=input_mint,
+        output_mint=output_mint,
+        input_amount=amount,
+        input_symbol="IN",
+        output_symbol="TKN",
+        slippage_bps=100,
+    )
+
+
+@pytest.fixture
+def guard():
+    return SwapGuardAgent()
+
+
+@pytest.fixture
+def analyzed(guard):
+    """Record every mint the guard analyzes; analyses come from guard.fixtures"""
+    calls = []
+    guard.fixtures = {}
+
+    async def analyze(mint, symbol):
+        calls.append(mint)
+        analysis = guard.fixtures.get(mint) or make_analysis(mint)
+        guard.analyze_batch([analysis])
+        return analysis
+
+    guard._analyze_token = analyze
+    return calls
+
+
+class TestDustFastPath:
+    """Tests for approving tiny swaps without analysis"""
+
+    @pytest.mark.asyncio
+    async def test_sol_dust_approved_with_warning(self, guard, analyzed):
+        decision = await guard.evaluate_swap(make_request(0.001))
+
+        assert analyzed == []
+        assert decision.action == SwapAction.APPROVE
+        assert decision.risk_level != SwapRisk.SAFE
+        assert decision.confidence == UNANALYZED_CONFIDENCE
+        assert len(decision.warnings) == 1
+        assert "not analyzed" in decision.warnings[0]
+        assert guard.stats["dust_fast_path"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_sol_input_is_analyzed(self, guard, analyzed):
+        """0.009 wBTC is not dust, whatever the number says"""
+        decision = await guard.evaluate_swap(make_request(0.009, input_mint=WBTC_MINT))
+
+        assert analyzed == [UNKNOWN_MINT]
+        assert decision.token_analysis is not None
+        assert guard.stats["dust_fast_path"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_honeypot_never_fast_pathed(self, guard, analyzed):
+        guard.fixtures[UNKNOWN_MINT] = make_analysis(is_honeypot=True, can_sell=False)
+        await guard.evaluate_swap(make_request(1.0))
+
+        decision = await guard.evaluate_swap(make_request(0.001))
+
+        assert analyzed == [UNKNOWN_MINT]  # Second verdict came from the cache
+        assert decision.action == SwapAction.REJECT
+        assert decision.risk_level == SwapRisk.CRITICAL
+
+    @pytest.mark.asyncio
+    async def test_batch_dust_uses_analysis_of_same_mint(self, guard, analyzed):
+        """A dust request shares the verdict when the batch analyzes its mint anyway"""
+        guard.fixtures[UNKNOWN_MINT] = make_analysis(is_honeypot=True, can_sell=False)
+
+        decisions = await guard.evaluate_swaps_batch([
+            make_request(0.001, id="dust"),
+            make_request(1.0, id="full"),
+        ])
+
+        assert analyzed == [UNKNOWN_MINT]
+        assert [d.request_id for d in decisions] == ["dust", "full"]
+        assert all(d.action == SwapAction.REJECT for d in decisions)
+
+
+class TestInFlightAnalysis:
+    """Tests for sharing one analysis between concurrent callers"""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self, guard):
+        release = asyncio.Event()
+
+        async def analyze(mint, symbol):
+            await release.wait()
+            analysis = make_analysis(mint)
+            guard.analyze_batch([analysis])
+            return analysis
+
+        guard._analyze_token = analyze
+
+        leader = asyncio.create_task(guard._get_token_analysis(UNKNOWN_MINT, "TKN"))
+        follower = asyncio.create_task(guard._get_token_analysis(UNKNOWN_MINT, "TKN"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        analysis = await follower
+
+        assert leader.cancelled()
+        assert analysis.mint == UNKNOWN_MINT
+        assert UNKNOWN_MINT in guard.analysis_cache
+        await asyncio.sleep(0)
+        assert guard._in_flight == {}
+
+
+# (honeypot, rugpull, liquidity, concentration) risks scoring exactly on each risk threshold
+BOUNDARY_RISKS = {
+    20.0: (0, 0, 0, 100),
+    40.0: (0, 0, 80, 100),
+    60.0: (0, 60, 100, 100),
+    80.0: (40, 100, 100, 90),
+}
+
+
+def risk_analysis(risks, **flags) -> TokenAnalysis:
+    honeypot, rugpull, liquidity, concentration = risks
+    return make_analysis(
+        honeypot_risk=float(honeypot),
+        rugpull_risk=float(rugpull),
+        liquidity_risk=float(liquidity),
+        concentration_risk=float(concentration),
+        **flags,
+    )
+
+
+def batch_analyses():
+    """Boundary, just-off-boundary, flagged and random rows"""
+    analyses = []
+    for score, risks in BOUNDARY_RISKS.items():
+        analyses.append(risk_analysis(risks))
+        below = (risks[0], risks[1], risks[2], risks[3] - 1)
+        analyses.append(risk_analysis(below))
+    analyses.append(risk_analysis((0, 0, 0, 0)))
+    analyses.append(risk_analysis((100, 100, 100, 100)))
+    analyses.append(risk_analysis((10, 10, 10, 10), is_honeypot=True))
+    analyses.append(risk_analysis((10, 10, 10, 10), is_blacklisted=True))
+    analyses.append(risk_analysis((100, 100, 100, 100), is_verified=True))
+    analyses.append(risk_analysis(BOUNDARY_RISKS[40.0], is_verified=True))
+
+    rng = random.Random(1234)
+    for _ in range(500):
+        risks = tuple(rng.uniform(0, 100) for _ in range(4))
+        analyses.append(risk_analysis(
+            risks,
+            is_verified=rng.random() < 0.3,
+            is_honeypot=rng.random() < 0.05,
+            is_blacklisted=rng.random() < 0.05,
+        ))
+    return analyses
+
+
+def scalar_outcome(guard, analysis):
+    """(score, level, action, max safe amount) from the one-at-a-time methods"""
+    analysis = copy.copy(analysis)
+    analysis.overall_risk = guard._calculate_overall_risk(analysis)
+    analysis.risk_level = guard._determine_risk_level(analysis)
+    action = guard._determine_action(analysis)
+    return (
+        analysis.overall_risk,
+        analysis.risk_level,
+        action,
+        guard.position_limits.get(analysis.risk_level, 0.0),
+    )
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def risk_kernel(request, monkeypatch):
+    """Run analyze_batch on the NumPy fallback, then on the numba kernel"""
+    if request.param == "numba":
+        numba = pytest.importorskip("numba")
+        kernel = numba.njit(swapguard_agent._score_rows_loop)
+    else:
+        kernel = swapguard_agent._score_rows_numpy
+    monkeypatch.setattr(swapguard_agent, "_risk_kernel", kernel)
+    return request.param
+
+
+class TestAnalyzeBatch:
+    """Tests for batch scoring against the scalar path"""
+
+    def test_boundary_risks_score_exactly(self, guard):
+        for score, risks in BOUNDARY_RISKS.items():
+            assert guard._calculate_overall_risk(risk_analysis(risks)) == score
+
+    def test_batch_matches_scalar(self, guard, risk_kernel):
+        analyses = batch_analyses()
+        expected = [scalar_outcome(guard, a) for a in analyses]
+
+        scores = guard.analyze_batch(analyses)
+
+        assert scores.tolist() == [score for score, *_ in expected]
+        assert [
+            (a.overall_risk, a.risk_level, a.recommended_action, a.max_safe_amount_sol)
+            for a in analyses
+        ] == expected
+
+    def test_boundary_levels(self, guard, risk_kernel):
+        analyses = [risk_analysis(risks) for risks in BOUNDARY_RISKS.values()]
+
+        guard.analyze_batch(analyses)
+
+        # Thresholds are "below this": a score on the edge lands in the next level
+        assert [a.risk_level for a in analyses] == [
+            SwapRisk.LOW, SwapRisk.MEDIUM, SwapRisk.HIGH, SwapRisk.CRITICAL,
+        ]
+
+    def test_flagged_rows(self, guard, risk_kernel):
+        honeypot = risk_analysis((0, 0, 0, 0), is_honeypot=True, is_verified=True)
+        blacklisted = risk_analysis((0, 0, 0, 0), is_blacklisted=True)
+        verified = risk_analysis((100, 100, 100, 100), is_verified=True)
+
+        scores = guard.analyze_batch([honeypot, blacklisted, verified])
+
+        assert scores.tolist() == [100.0, 0.0, pytest.approx(70.0)]
+        assert honeypot.risk_level == SwapRisk.CRITICAL
+        assert blacklisted.risk_level == SwapRisk.BLOCKED
+        assert verified.risk_level == SwapRisk.HIGH
+        assert honeypot.recommended_action == blacklisted.recommended_action == SwapAction.REJECT
+
+    def test_empty_batch(self, guard):
+        assert guard.analyze_batch([]).shape == (0,)
+
+
+class TestEvaluateSwapsBatch:
+    """Tests for batch swap evaluation against evaluate_swap"""
+
+    RISKY_MINT = "Risky11111111111111111111111111111111111111"
+    HONEYPOT_MINT = "Honeypot111111111111111111111111111111111111"
+    BLACKLISTED_MINT = "Blacklisted1111111111111111111111111111111111"
+
+    def requests(self):
+        return [
+            make_request(1.0, output_mint=self.RISKY_MINT, id="risky-1"),
+            make_request(5.0, output_mint=UNKNOWN_MINT, id="clean"),
+            make_request(1.0, output_mint=self.HONEYPOT_MINT, id="honeypot"),
+            make_request(50.0, output_mint=self.RISKY_MINT, id="risky-2"),
+            make_request(1.0, output_mint=USDC_MINT, id="whitelisted"),
+            make_request(1.0, output_mint=self.BLACKLISTED_MINT, id="blacklisted"),
+            make_request(0.001, output_mint=self.RISKY_MINT, id="risky-dust"),
+        ]
+
+    def prepare(self, guard):
+        guard.add_to_blacklist(self.BLACKLISTED_MINT)
+        guard.fixtures[self.RISKY_MINT] = risk_analysis(BOUNDARY_RISKS[60.0], mint=self.RISKY_MINT)
+        guard.fixtures[self.HONEYPOT_MINT] = risk_analysis(
+            (0, 0, 0, 0), mint=self.HONEYPOT_MINT, is_honeypot=True, can_sell=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_order_and_dedup(self, guard, analyzed):
+        self.prepare(guard)
+
+        decisions = await guard.evaluate_swaps_batch(self.requests())
+
+        assert [d.request_id for d in decisions] == [r.id for r in self.requests()]
+        assert sorted(analyzed) == sorted({self.RISKY_MINT, UNKNOWN_MINT, self.HONEYPOT_MINT})
+
+    @pytest.mark.asyncio
+    async def test_matches_evaluate_swap(self, analyzed):
+        batch_guard = SwapGuardAgent()
+        scalar_guard = SwapGuardAgent()
+        for g in (batch_guard, scalar_guard):
+            g.fixtures = {}
+
+            async def analyze(mint, symbol, g=g):
+                analysis = copy.copy(g.fixtures.get(mint) or make_analysis(mint))
+                g.analyze_batch([analysis])
+                return analysis
+
+            g._analyze_token = analyze
+            self.prepare(g)
+
+        batch = await batch_guard.evaluate_swaps_batch(self.requests())
+        scalar = [await scalar_guard.evaluate_swap(r) for r in self.requests()]
+
+        def summary(d):
+            return (d.request_id, d.action, d.risk_level, d.warnings, d.confidence,
+                    d.max_safe_amount, d.safe_swap_params)
+
+        assert [summary(d) for d in batch] == [summary(d) for d in scalar]
+        assert batch_guard.stats == scalar_guard.stats
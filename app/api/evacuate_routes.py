@@ -255,7 +255,7 @@ async def create_evacuation_plan(request: CreatePlanRequest):
             estimated_transactions=plan.estimated_transactions,
             estimated_fee_sol=plan.estimated_fee_sol,
             estimated_time_seconds=plan.estimated_time_seconds,
-            assets=[evacuator._asset_to_dict(a) for a in plan.assets],
+            assets=[a.to_dict() for a in plan.assets],
             ready_to_execute=True,
         )
         
@@ -388,7 +388,7 @@ async def get_safe_wallets(user_wallet: str):
     🏠 Get registered safe wallets for a user.
     """
     evacuator = get_evacuator()
-    safe_wallets = evacuator.safe_wallets.get(user_wallet, [])
+    safe_wallets = evacuator.safe_wallets.get(user_wallet, {})
     
     return {
         "user_wallet": user_wallet[:16] + "...",
@@ -52,6 +52,11 @@ websocket_connections: List[WebSocket] = []
 async def lifespan(app: FastAPI):
     """Startup and shutdown"""
     logger.info("GUARDIAN API starting...")
+    # Agent tasks (honeypot monitor, event flushes) start eagerly so
+    # coroutines that finish without blocking skip the scheduler (3.12+).
+    # uvicorn already runs on uvloop when it is installed.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     yield
     logger.info("GUARDIAN API shutting down...")
 
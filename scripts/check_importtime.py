@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Import-time regression gate for the GUARDIAN package
+
+Reads `python -X importtime` output on stdin and fails if `import GUARDIAN`
+gets too slow, which usually means an agent module is being imported
+eagerly again instead of through the lazy __getattr__ in __init__.py.
+
+Usage:
+    python -X importtime -c "import GUARDIAN" 2>&1 | python scripts/check_importtime.py
+"""
+import re
+import sys
+
+MAX_PACKAGE_CUMULATIVE_US = 500_000  # Total cost of `import GUARDIAN`
+MAX_MODULE_SELF_US = 200_000         # Any single module's own import cost
+
+ROW = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def main() -> int:
+    package_cumulative = None
+    failures = []
+
+    for line in sys.stdin:
+        match = ROW.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        self_us, cumulative_us = int(self_us), int(cumulative_us)
+
+        if module == "GUARDIAN" and len(indent) == 1:
+            package_cumulative = cumulative_us
+        if self_us > MAX_MODULE_SELF_US:
+            failures.append(f"{module}: self {self_us}us > {MAX_MODULE_SELF_US}us")
+
+    if package_cumulative is None:
+        print("❌ No `import GUARDIAN` row found - was -X importtime output piped in?")
+        return 1
+    if package_cumulative > MAX_PACKAGE_CUMULATIVE_US:
+        failures.append(
+            f"GUARDIAN: cumulative {package_cumulative}us > {MAX_PACKAGE_CUMULATIVE_US}us"
+        )
+
+    if failures:
+        print("❌ Import time budget exceeded:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+
+    print(f"✅ import GUARDIAN: {package_cumulative}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())